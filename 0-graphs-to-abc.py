@@ -1,10 +1,20 @@
+import re
+
 import knotpy as kp
 
+# patterns like 1[2  3  4  5]
+_BLOCK_RE = re.compile(r'\d+\[([0-9\s]+)\]')
+
 
 def num_to_char(n: int) -> str:
     """Convert 1 -> 'a', 2 -> 'b', ..."""
     return chr(ord('a') + n - 1)
 
+
+# lookup table for node labels: "1" -> 'a', "2" -> 'b', ...
+_DIGIT_TO_CHAR = {str(n): num_to_char(n) for n in range(1, 27)}
+
+
 def process_line(line: str) -> str:
     # Remove leading ID (everything before the first colon)
     if ":" in line:
@@ -12,25 +22,27 @@ def process_line(line: str) -> str:
 
     output_chars = []
 
-    import re
-    # Find patterns like 1[2  3  4  5]
-    blocks = re.findall(r'\d+\[([0-9\s]+)\]', line)
-
-    for block in blocks:
+    for block in _BLOCK_RE.findall(line):
         # Get numbers inside the brackets
         nums = block.split()
         # Convert each to a letter
-        chars = ''.join(num_to_char(int(n)) for n in nums)
+        chars = ''.join(_DIGIT_TO_CHAR[n] for n in nums)
         output_chars.append(chars)
 
     # Return them joined by a space, or however you want them formatted
     return ' '.join(output_chars)
 
-def process_file(infile: str, outfile: str):
-    with open(infile, 'r') as f_in, open(outfile, 'w') as f_out:
+def process_file(infile: str, outfile: str, batch_size: int = 10000):
+    # collect converted lines and write them in batches (one join + write per batch)
+    with open(infile, 'r') as f_in, open(outfile, 'w', buffering=1 << 20) as f_out:
+        buf = []
         for line in f_in:
-            result = process_line(line).replace(" ", ",")
-            f_out.write(result + "\n")
+            buf.append(process_line(line).replace(" ", ","))
+            if len(buf) >= batch_size:
+                f_out.write("\n".join(buf) + "\n")
+                buf.clear()
+        if buf:
+            f_out.write("\n".join(buf) + "\n")
 
 
 process_file("graphs10.txt", "graphs_abc_10.txt")
\ No newline at end of file
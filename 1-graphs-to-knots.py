@@ -1,3 +1,5 @@
+import multiprocessing as mp
+
 import knotpy as kp
 
 # generiramo vse grafe z 2,... 7/8 vozlišč
@@ -12,60 +14,70 @@ import knotpy as kp
 # knots = [k for k in knots if not kp.is_connected_sum(k)]
 
 
-# n = 2,3,4,5,6,7, 8?
-graphs_10 = kp.load_diagrams("graphs_abc_10.txt", notation="plantri")
-#graphs_2 = kp.load_diagrams("graphs_abc_2.txt", notation="plantri")
-#graphs_3 = kp.load_diagrams("graphs_abc_3.txt", notation="plantri")
-"""
-...
-
-"""
-all_graphs = graphs_10 #+ graphs_2 + graphs_3
+def _canon_worker(k):
+    """Simplify and canonicalize a single diagram (run in a worker process)."""
+    #k = kp.simplify(k, depth=0)
+    k = kp.simplify_decreasing(k)  # greedy
+    return kp.canonical(k)
 
-print("Loaded", len(graphs_10), "graphs")
 
+def main():
+    # n = 2,3,4,5,6,7, 8?
+    graphs_10 = kp.load_diagrams("graphs_abc_10.txt", notation="plantri")
+    #graphs_2 = kp.load_diagrams("graphs_abc_2.txt", notation="plantri")
+    #graphs_3 = kp.load_diagrams("graphs_abc_3.txt", notation="plantri")
+    """
+    ...
 
+    """
+    all_graphs = graphs_10 #+ graphs_2 + graphs_3
 
+    print("Loaded", len(graphs_10), "graphs")
 
-good_graphs = []
-for g in graphs_10:
-    d = kp.degree_sequence(g)
-    if max(d) <= 4 and min(d) >= 3:
-        if sum([1 for n in d if n == 3]) % 2 == 0:
-            good_graphs.append(g)
+    good_graphs = []
+    for g in graphs_10:
+        d = kp.degree_sequence(g)
+        if max(d) <= 4 and min(d) >= 3:
+            if sum([1 for n in d if n == 3]) % 2 == 0:
+                good_graphs.append(g)
 
-print("Good graphs", len(good_graphs))
+    print("Good graphs", len(good_graphs))
 
-kp.save_diagrams("1-good_graphs.txt", good_graphs)
+    kp.save_diagrams("1-good_graphs.txt", good_graphs)
 
-kp.export_pdf(good_graphs[:5], "1-good_graphs_ex.pdf")
+    kp.export_pdf(good_graphs[:5], "1-good_graphs_ex.pdf")
 
-knots = []
-for g in good_graphs:
-    for k in kp.vertices_to_crossings(g, all_crossing_signs=True):
-        knots.append(k)
+    knots = []
+    for g in good_graphs:
+        for k in kp.vertices_to_crossings(g, all_crossing_signs=True):
+            knots.append(k)
 
-print("Good bonded knots", len(knots))
-kp.save_diagrams("1-all_bonded_knots.txt", knots)
+    print("Good bonded knots", len(knots))
+    kp.save_diagrams("1-all_bonded_knots.txt", knots)
 
-canonical_knots = set()
-for k in kp.bar(knots):
-    #k = kp.simplify(k, depth=0)
-    k = kp.simplify_decreasing(k)  # greedy
-    k = kp.canonical(k)
-    canonical_knots.add(k)
+    # diagrams are independent, process them in parallel (chunksize amortizes the pickling cost)
+    canonical_knots = set()
+    with mp.Pool() as pool:
+        # cheap filter: many sign assignments are isomorphic, so canonicalize the raw diagrams first and run the
+        # expensive simplification only once per isomorphism class
+        pre_canonical_knots = set(kp.bar(pool.imap_unordered(kp.canonical, knots, chunksize=64), total=len(knots)))
+        print("Distinct bonded knot diagrams", len(pre_canonical_knots))
 
-#Good bonded knots 46981
-#kp.is_connected_sum(k)
+        for k in kp.bar(pool.imap_unordered(_canon_worker, pre_canonical_knots, chunksize=64), total=len(pre_canonical_knots)):
+            canonical_knots.add(k)
 
+    #Good bonded knots 46981
+    #kp.is_connected_sum(k)
 
+    """
 
-"""
+    """
 
-"""
+    print("Canonical bonded knots", len(canonical_knots))
+    kp.save_diagrams("1-all_canonical_bonded_knots.txt", canonical_knots)
 
-print("Canonical bonded knots", len(canonical_knots))
-kp.save_diagrams("1-all_canonical_bonded_knots.txt", canonical_knots)
+    kp.export_pdf(list(canonical_knots)[:50], "1-bonded-canonical-knots.pdf", ignore_errors=True)
 
 
-kp.export_pdf(list(canonical_knots)[:50], "1-bonded-canonical-knots.pdf", ignore_errors=True)
+if __name__ == "__main__":
+    main()
@@ -13,21 +13,23 @@ from knotpy.classes.node import Crossing
 from knotpy.algorithms.topology import edges
 
 
-def _parity_diff(values: list[int], cyclic: bool = False) -> list[int]:
-    """Return (mod 2) differences of consecutive entries.
+def _parity_alt_ok(values: bytes | list[int], cyclic: bool = False) -> bool:
+    """Return whether all second-order (mod 2) differences of consecutive entries are 1.
+
+    The second difference ``v[i+2] - 2*v[i+1] + v[i]`` has the parity of ``v[i] + v[i+2]``, so the two rounds of
+    differencing collapse into a single pass that compares each entry with the one two steps ahead and stops at
+    the first mismatch.
 
     Args:
-        values: List of integers.
-        cyclic: If True, treat the list as cyclic (compare last with first).
+        values: Small non-negative integers (bytes) or a list of integers.
+        cyclic: If True, treat the sequence as cyclic (wrap around at the end).
 
     Returns:
-        List of differences modulo 2.
+        True if every second-order difference is odd, False otherwise.
 
     """
-    if not values:
-        return []
-    data = values + values[:1] if cyclic else values
-    return [(b - a) % 2 for a, b in zip(data, data[1:])]
+    ahead = values[2:] + values[:2] if cyclic else values[2:]
+    return all((a + b) & 1 for a, b in zip(values, ahead))
 
 
 def is_alternating(k: Diagram) -> bool:
@@ -48,21 +50,24 @@ def is_alternating(k: Diagram) -> bool:
         False
     """
 
+    crossings = {node for node, inst in k.nodes.items() if isinstance(inst, Crossing)}
+
     def _edge_is_alternating(edge: list) -> bool:
         # An edge is a list of endpoints; use their .position modulo 2.
         starts_at_crossing = (
-            isinstance(k.nodes[edge[0].node], Crossing)
-            and isinstance(k.nodes[edge[-1].node], Crossing)
+            edge[0].node in crossings
+            and edge[-1].node in crossings
             and edge[0].node == edge[-1].node
         )
         if starts_at_crossing:
-            seq = [ep.position for ep in edge]
+            # positions along an edge are crossing positions (0-3), so they fit in a compact bytes object
+            seq = bytes(ep.position for ep in edge)
             # Two rounds of parity differences must all be 1 for a 4-valent crossing alternation.
-            return all(x == 1 for x in _parity_diff(_parity_diff(seq, cyclic=True), cyclic=True))
+            return _parity_alt_ok(seq, cyclic=True)
         else:
             # Skip the free endpoints at ends; check interior parity alternation.
-            seq = [ep.position for ep in edge[1:-1]]
-            return all(x == 1 for x in _parity_diff(_parity_diff(seq, cyclic=False), cyclic=False))
+            seq = bytes(ep.position for ep in edge[1:-1])
+            return _parity_alt_ok(seq, cyclic=False)
 
     return all(_edge_is_alternating(edge) for edge in edges(k))
 
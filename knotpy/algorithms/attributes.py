@@ -38,12 +38,24 @@ def _as_attr_list(attr) -> list[str] | None:
 
 
 def _iter_diagrams(obj: Diagram | DiagramCollection):
-    """Yield diagrams from a diagram or a collection of diagrams."""
-    if isinstance(obj, (list, set, tuple)):
-        for d in obj:
-            yield from _iter_diagrams(d)
-    else:
+    """Yield diagrams from a diagram or a (possibly nested) collection of diagrams.
+
+    Nested collections are flattened with an explicit stack of iterators instead of recursion,
+    so a single generator frame is used regardless of the collection size.
+    """
+    if not isinstance(obj, (list, set, tuple)):
         yield obj
+        return
+
+    stack = [iter(obj)]
+    while stack:
+        for d in stack[-1]:
+            if isinstance(d, (list, set, tuple)):
+                stack.append(iter(d))
+                break
+            yield d
+        else:
+            stack.pop()
 
 
 def clear_node_attributes(k: Diagram | DiagramCollection, attr: str | list[str] | set[str] | tuple[str, ...] | None = None) -> None:
@@ -163,11 +175,24 @@ def clear_temporary_diagram_attributes(k: Diagram | DiagramCollection, attr: str
                     d.attr.pop(key, None)
 
 
+def _pop_temporary_keys(attr: dict) -> None:
+    """Remove keys starting with '_' from an attribute dict."""
+    for key in [key for key in attr if isinstance(key, str) and key.startswith("_")]:
+        del attr[key]
+
+
 def clear_temporary_attributes(k: Diagram | DiagramCollection) -> None:
-    """Clear all temporary attributes (keys starting with '_') at all levels."""
-    clear_temporary_node_attributes(k)
-    clear_temporary_endpoint_attributes(k)
-    clear_temporary_diagram_attributes(k)
+    """Clear all temporary attributes (keys starting with '_') at all levels.
+
+    All three levels are cleared in a single pass, so each diagram is traversed only once.
+    """
+    for d in _iter_diagrams(k):
+        for node_inst in d.nodes.values():
+            _pop_temporary_keys(node_inst.attr)
+            # every endpoint is stored exactly once in some node's incidence list
+            for ep in node_inst:
+                _pop_temporary_keys(ep.attr)
+        _pop_temporary_keys(d.attr)
 
 
 if __name__ == "__main__":
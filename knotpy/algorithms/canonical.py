@@ -9,24 +9,39 @@ relabeling nodes via a CCW BFS strategy from carefully chosen starting endpoints
 canonicalized independently and reassembled in canonical order.
 """
 
-__all__ = ["canonical", "canonical_generator"]
+__all__ = ["canonical", "canonical_generator", "canonical_many"]
 __version__ = "1.0"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from collections.abc import Iterable
-from queue import Queue
 from string import ascii_letters
 
 from knotpy.classes.planardiagram import PlanarDiagram
-from knotpy.classes.node import Crossing
+from knotpy.classes.endpoint import IngoingEndpoint
+from knotpy.classes.node import Crossing, Vertex
 from knotpy.algorithms.degree_sequence import neighbour_sequence
-from knotpy.algorithms.disjoint_union import number_of_disjoint_components, disjoint_union_decomposition, disjoint_union
+from knotpy.algorithms.disjoint_union import _disjoint_components_nodes, _components_from_node_sets
 from knotpy.algorithms.rewire import permute_node
 
 
-def _under_endpoints_of_node(k: PlanarDiagram, node):
+# Node names a,b,...,z,A,...,Z,aa,ab,... shared by all canonical() calls, extended on demand
+_NODE_NAMES = list(ascii_letters)
+
+
+def _node_names(n: int) -> list[str]:
+    """Return the first ``n`` canonical node names."""
+    if n > len(_NODE_NAMES):
+        from knotpy.algorithms.naming import number_to_alpha
+        _NODE_NAMES.extend(number_to_alpha(i) for i in range(len(_NODE_NAMES), n))
+    return _NODE_NAMES[:n]
+
+
+def _under_endpoints_of_node(k: PlanarDiagram, node, crossings: set):
     """Endpoints to start from: under-endpoints for crossings; all for vertices."""
-    if isinstance(k.nodes[node], Crossing):
+    if node in crossings:
         return [(node, 0), (node, 2)]
     return [(node, pos) for pos in range(k.degree(node))]
 
@@ -66,25 +81,27 @@ def _ccw_expand_node_names(k: PlanarDiagram, endpoint, node_names: list[str]):
     """
     node_relabel: dict = {}  # keys are old node names, values ar enew node names
     node_first_position: dict = {}
-    q = Queue()
-    q.put(endpoint)
+    nodes = k._nodes  # local binding, avoids the view lookup in the loop
+    q = deque([endpoint])
 
-    while not q.empty():
-        v, pos = q.get()
+    while q:
+        v, pos = q.popleft()
+        v_inst = nodes[v]
 
         if v not in node_relabel:
             new_name = node_names[len(node_relabel)]
             node_relabel[v] = new_name
             node_first_position[new_name] = pos
-            deg = k.degree(v)
+            deg = len(v_inst)
             # push CCW-ordered positions at v
             for rpos in range(1, deg):
-                q.put((v, (pos + rpos) % deg))
+                q.append((v, (pos + rpos) % deg))
 
         # traverse to adjacent endpoint
-        adj_v, adj_pos = k.nodes[v][pos]
+        adj_ep = v_inst._inc[pos]
+        adj_v, adj_pos = adj_ep.node, adj_ep.position
         if adj_v not in node_relabel:
-            q.put((adj_v, adj_pos))
+            q.append((adj_v, adj_pos))
 
     return node_relabel, node_first_position
 
@@ -97,6 +114,26 @@ def canonical_generator(diagrams: Iterable[PlanarDiagram]):
         yield canonical(d)
 
 
+def canonical_many(diagrams: Iterable[PlanarDiagram], max_workers: int | None = None) -> list[PlanarDiagram]:
+    """
+    Return the canonical forms of many diagrams, computed in parallel using processes.
+
+    Args:
+        diagrams: Iterable of diagrams.
+        max_workers: Number of workers; defaults to ``os.cpu_count()``.
+
+    Returns:
+        list: Canonical forms, in the order of the input diagrams.
+    """
+    diagrams = list(diagrams)
+    if not diagrams:
+        return []
+    max_workers = max_workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunksize = max(1, len(diagrams) // (4 * max_workers))
+        return list(executor.map(canonical, diagrams, chunksize=chunksize))
+
+
 def canonical(k: PlanarDiagram | set | list | tuple | Iterable[PlanarDiagram]) -> PlanarDiagram | set | list | tuple:
     """
     Compute the canonical form of an *unoriented* planar diagram.
@@ -134,8 +171,6 @@ def canonical(k: PlanarDiagram | set | list | tuple | Iterable[PlanarDiagram]) -
         TypeError: If a non-diagram is provided.
         ValueError: If the input diagram is not connected when expected.
     """
-    from knotpy.algorithms.naming import number_to_alpha
-
     # Handle collections
     if isinstance(k, (set, list, tuple)):
         return type(k)(canonical(d) for d in k)
@@ -149,27 +184,41 @@ def canonical(k: PlanarDiagram | set | list | tuple | Iterable[PlanarDiagram]) -
         return k.copy()
 
     # Node name supply: a,b,...,z,A,...,Z,aa,ab,...
-    if len(k) <= len(ascii_letters):
-        letters = list(ascii_letters[: len(k)])
-    else:
-        letters = [number_to_alpha(i) for i in range(len(k))]
+    letters = _node_names(len(k))
 
     # Disconnected case: canonicalize components and merge canonically
-    if number_of_disjoint_components(k) >= 2:
+    # (the component scan is done once and reused for the decomposition)
+    components_nodes = _disjoint_components_nodes(k)
+    if len(components_nodes) >= 2:
         old_name = getattr(k, "name", None)
-        comps = [canonical(c) for c in disjoint_union_decomposition(k)]
-        ds = disjoint_union(*sorted(comps))
+        comps = sorted(canonical(c) for c in _components_from_node_sets(k, components_nodes))
+        ds = _merge_canonical_components(comps, letters)
         ds.name = old_name
         return ds
 
+    # A connected unoriented diagram of bivalent vertices is a cycle, and its symmetries act transitively on the
+    # endpoints: every start yields the same key, so the first endpoint is enough
+    if not k.is_oriented() and all(type(inst) is Vertex and len(inst._inc) == 2 for inst in k._nodes.values()):
+        node_relabel, node_first_pos = _ccw_expand_node_names(k, (next(iter(k._nodes)), 0), letters)
+        return _relabeled_diagram(k, node_relabel, node_first_pos)
+
     # Candidates: nodes with minimal degree, then minimal neighbor sequence
     minimal_nodes = _min_elements_by(k.nodes, k.degree)
-    minimal_nodes = _min_elements_by(minimal_nodes, lambda n: neighbour_sequence(k, n))
+    neighbour_sequences = {n: neighbour_sequence(k, n) for n in minimal_nodes}
+    minimal_nodes = _min_elements_by(minimal_nodes, neighbour_sequences.__getitem__)
+
+    # Crossing membership is needed for every candidate, compute it once
+    crossings = {node for node, inst in k._nodes.items() if isinstance(inst, Crossing)}
 
     # Start from under-endpoints of candidate nodes
-    start_eps = [ep for n in minimal_nodes for ep in _under_endpoints_of_node(k, n)]
+    start_eps = [ep for n in minimal_nodes for ep in _under_endpoints_of_node(k, n, crossings)]
+
+    # A connected diagram without endpoints is a single isolated node, only its name has to be canonical
+    if not start_eps:
+        return _relabeled_diagram(k, {minimal_nodes[0]: letters[0]}, {letters[0]: 0})
 
-    best = None
+    # Compare candidates by plain-tuple keys; only the winning relabeling is turned into a diagram
+    best_key = best_relabel = best_first_pos = None
 
     for ep_start in start_eps:
         node_relabel, node_first_pos = _ccw_expand_node_names(k, ep_start, letters)
@@ -177,24 +226,125 @@ def canonical(k: PlanarDiagram | set | list | tuple | Iterable[PlanarDiagram]) -
         if len(node_relabel) != len(k):
             raise ValueError("Cannot put a non-connected graph into canonical form.")
 
-        # Relabel nodes and endpoints
-        new_g = k.copy()
-        new_g._nodes = {
-            node_relabel[old_node]: type(old_inst)(
-                [
-                    type(ep)(node_relabel[ep.node], ep.position)
-                    for ep in old_inst._inc
-                ]
+        key = _relabeled_diagram_key(k, node_relabel, node_first_pos, crossings)
+        if best_key is None or key < best_key:
+            best_key, best_relabel, best_first_pos = key, node_relabel, node_first_pos
+
+    return _relabeled_diagram(k, best_relabel, best_first_pos)
+
+
+def _relabeled_diagram(k: PlanarDiagram, node_relabel: dict, node_first_position: dict) -> PlanarDiagram:
+    """
+    Return a copy of ``k`` with nodes relabeled and endpoints canonically permuted.
+
+    Args:
+        k: Planar diagram.
+        node_relabel: Maps old node -> new name.
+        node_first_position: Maps new name -> first position visited.
+
+    Returns:
+        PlanarDiagram: The relabeled diagram.
+    """
+    # Relabel nodes and endpoints
+    new_k = k.copy()
+    new_k._nodes = {
+        node_relabel[old_node]: type(old_inst)(
+            [
+                type(ep)(node_relabel[ep.node], ep.position)
+                for ep in old_inst._inc
+            ]
+        )
+        for old_node, old_inst in k._nodes.items()
+    }
+
+    _canonically_permute_nodes_with_given_first_positions(new_k, node_first_position)
+
+    return new_k
+
+
+def _relabeled_diagram_key(k: PlanarDiagram, node_relabel: dict, node_first_position: dict, crossings: set) -> tuple:
+    """
+    Return a comparison key of the diagram that relabeling and canonically permuting ``k`` would produce.
+
+    Keys of two candidates compare the same way as the resulting diagrams do (node by node in sorted order:
+    degree, node type, endpoints), but are built from plain tuples instead of new diagrams.
+
+    Args:
+        k: Planar diagram.
+        node_relabel: Maps old node -> new name.
+        node_first_position: Maps new name -> first position visited.
+        crossings: Set of (old) crossing nodes of ``k``.
+
+    Returns:
+        tuple: Comparison key.
+    """
+    k_nodes = k._nodes
+
+    # New position of each old position, as set by _canonically_permute_nodes_with_given_first_positions
+    new_positions = {}
+    for old_node, old_inst in k_nodes.items():
+        first_pos = node_first_position[node_relabel[old_node]]
+        deg = len(old_inst)
+        is_crossing = old_node in crossings
+        if first_pos == 0 or (is_crossing and first_pos == 3):
+            new_positions[old_node] = range(deg)
+        elif is_crossing:
+            new_positions[old_node] = (2, 3, 0, 1)
+        else:
+            new_positions[old_node] = [(i - first_pos) % deg for i in range(deg)]
+
+    key = []
+    for old_node, old_inst in k_nodes.items():
+        node_positions = new_positions[old_node]
+        inc = [None] * len(old_inst)
+        for pos, ep in enumerate(old_inst._inc):
+            # ingoing endpoints are larger than outgoing ones
+            inc[node_positions[pos]] = (
+                type(ep) is IngoingEndpoint,
+                node_relabel[ep.node],
+                new_positions[ep.node][ep.position],
+            )
+        key.append((node_relabel[old_node], len(old_inst), type(old_inst).__name__, tuple(inc)))
+    key.sort()
+    return tuple(key)
+
+
+def _merge_canonical_components(components: list[PlanarDiagram], node_names: list[str]) -> PlanarDiagram:
+    """
+    Merge sorted canonical components into a single diagram in one renaming pass.
+
+    A canonical component with n nodes is named by the first n node names; the components are renamed
+    consecutively (component by component, in node-name order), so the result does not depend on the
+    insertion order of the nodes.
+
+    Args:
+        components: Canonical connected diagrams in canonical order.
+        node_names: Ordered list of new node names (at least as many as nodes in total).
+
+    Returns:
+        PlanarDiagram: The disjoint sum of the components.
+    """
+    new_k = type(components[0])()
+    new_nodes = {}
+    names = iter(node_names)
+
+    for comp in components:
+        new_k.attr.update(comp.attr)
+        relabel = {node: next(names) for node in node_names[: len(comp)]}
+        for node, new_node in relabel.items():
+            inst = comp._nodes[node]
+            new_nodes[new_node] = type(inst)(
+                [type(ep)(relabel[ep.node], ep.position, **ep.attr) for ep in inst._inc],
+                **inst.attr,
             )
-            for old_node, old_inst in k._nodes.items()
-        }
 
-        _canonically_permute_nodes_with_given_first_positions(new_g, node_first_pos)
+    new_k._nodes = new_nodes
 
-        if best is None or new_g < best:
-            best = new_g
+    # framing: sum when any is present; else None (as in disjoint_union)
+    if any(comp.framing is not None for comp in components):
+        new_k.framing = sum(comp.framing or 0 for comp in components)
 
-    return best
+    return new_k
 
 
 def _canonically_permute_nodes_with_given_first_positions(k: PlanarDiagram, node_first_position: dict) -> None:
@@ -204,13 +354,14 @@ def _canonically_permute_nodes_with_given_first_positions(k: PlanarDiagram, node
     For crossings: if first_pos == 3, use the 180° rotation permutation [2,3,0,1].
     For vertices: rotate so that `first_pos` moves to 0.
     """
-    for node in k.nodes:
+    for node, inst in k._nodes.items():
         first_pos = node_first_position[node]
+        is_crossing = isinstance(inst, Crossing)
 
-        if first_pos == 0 or (isinstance(k.nodes[node], Crossing) and first_pos == 3):
+        if first_pos == 0 or (is_crossing and first_pos == 3):
             continue
 
-        if isinstance(k.nodes[node], Crossing):
+        if is_crossing:
             permutation = [2, 3, 0, 1]
         else:
             deg = k.degree(node)
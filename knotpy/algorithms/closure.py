@@ -38,26 +38,27 @@ def _bfs_shortest_path(graph: PlanarDiagram, start, goal):
         list: A list representing the nodes in the shortest path from `start` to `goal`,
             including both endpoints. If no path exists, returns None.
     """
-    # Queue for exploring nodes and tracking paths
-    queue = deque([[start]])
-    visited = set()
+    # Parent pointers of discovered nodes (also serve as the visited set); the path is rebuilt once at the end
+    parents = {start: None}
+    queue = deque([start])
 
     while queue:
-        # Get the current path and node
-        path = queue.popleft()
-        node = path[-1]
+        node = queue.popleft()
 
         # Check if the goal is reached
         if node == goal:
+            path = []
+            while node is not None:
+                path.append(node)
+                node = parents[node]
+            path.reverse()
             return path  # This is the shortest path
 
-        # If the node hasn't been visited yet, explore its neighbors
-        if node not in visited:
-            visited.add(node)
-            for neighbor in graph.nodes[node]:
-                new_path = list(path)
-                new_path.append(neighbor.node)
-                queue.append(new_path)
+        for neighbor in graph.nodes[node]:
+            neighbor = neighbor.node
+            if neighbor not in parents:
+                parents[neighbor] = node
+                queue.append(neighbor)
 
     return None  # Return None if no path exists between start and goal
 
@@ -68,22 +69,22 @@ def _face_intersection_arc(k: PlanarDiagram, f, g):
     If face ``f`` contains arc ``(A, B)``, face ``g`` should contain ``(B, A)``.
     The returned pair is oriented so that the first endpoint is CCW with respect to ``f``.
     """
+    # Index consecutive pairs of g by (node of second, node of first, position of first); keep the first occurrence
+    g_pairs = {}
+    for j in range(len(g)):
+        g_first, g_second = g[j], g[(j + 1) % len(g)]
+        g_pairs.setdefault((g_second.node, g_first.node, g_first.position), g_second)
+
     for i in range(len(f)):
-        f_pair = (f[i], f[(i + 1) % len(f)])
-        for j in range(len(g)):
-            g_pair = (g[j], g[(j + 1) % len(g)])
-            if (
-                f_pair[0].node == g_pair[1].node
-                and f_pair[1].node == g_pair[0].node
-                and (f_pair[1].position + 1) % k.degree(f_pair[1].node) == g_pair[0].position
-            ):
-                return f_pair[1], g_pair[1]
+        f_first, f_second = f[i], f[(i + 1) % len(f)]
+        g_second = g_pairs.get((f_first.node, f_second.node, (f_second.position + 1) % k.degree(f_second.node)))
+        if g_second is not None:
+            return f_second, g_second
     return None
 
 
 def _underpass_closure(k: PlanarDiagram, A, B, arcs):
-    """Perform an underpass closure from leaf ``A`` to leaf ``B`` along ``arcs``."""
-    k = k.copy()
+    """Perform an underpass closure from leaf ``A`` to leaf ``B`` along ``arcs`` (in place)."""
     previous_open_endpoint = (A, 1)
     for ep_f, ep_g in arcs:
         crossing = unique_new_node_name(k)
@@ -102,8 +103,7 @@ def _underpass_closure(k: PlanarDiagram, A, B, arcs):
 
 
 def _overpass_closure(k: PlanarDiagram, A, B, arcs):
-    """Perform an overpass closure from leaf ``A`` to leaf ``B`` along ``arcs``."""
-    k = k.copy()
+    """Perform an overpass closure from leaf ``A`` to leaf ``B`` along ``arcs`` (in place)."""
     previous_open_endpoint = (A, 1)
     for ep_f, ep_g in arcs:
         crossing = unique_new_node_name(k)
@@ -122,8 +122,7 @@ def _overpass_closure(k: PlanarDiagram, A, B, arcs):
 
 
 def _over_and_under_closure(k: PlanarDiagram, A, B, arcs):
-    """Perform a double-sided closure: one overpass and one underpass from ``A`` to ``B``."""
-    k = k.copy()
+    """Perform a double-sided closure: one overpass and one underpass from ``A`` to ``B`` (in place)."""
     previous_open_endpoint_over = (A, 1)
     previous_open_endpoint_under = (A, 2)
     for ep_f, ep_g in arcs:
@@ -150,7 +149,7 @@ def _over_and_under_closure(k: PlanarDiagram, A, B, arcs):
     return k
 
 
-def closure(k: PlanarDiagram, over: bool = False, under: bool = False) -> PlanarDiagram:
+def closure(k: PlanarDiagram, over: bool = False, under: bool = False, inplace: bool = False) -> PlanarDiagram:
     """Close a knotoid by routing through the dual graph between its two degree-1 vertices.
 
     You must choose at least one of ``over`` or ``under``. If both are True, a double-sided
@@ -160,9 +159,10 @@ def closure(k: PlanarDiagram, over: bool = False, under: bool = False) -> Planar
         k: Planar diagram with exactly two leaves (degree-1 vertices).
         over: Use overpass closure.
         under: Use underpass closure.
+        inplace: If True, close ``k`` itself instead of a copy.
 
     Returns:
-        A new ``PlanarDiagram`` with the chosen closure applied.
+        The ``PlanarDiagram`` with the chosen closure applied (``k`` itself if ``inplace`` is True).
 
     Raises:
         ValueError: If neither over nor under is selected.
@@ -186,6 +186,10 @@ def closure(k: PlanarDiagram, over: bool = False, under: bool = False) -> Planar
     path = _bfs_shortest_path(dual, A_face, B_face)
     arcs = [_face_intersection_arc(k, f, g) for f, g in zip(path, path[1:])]
 
+    # the route is computed, copy once (if needed) and let the helpers modify the diagram in place
+    if not inplace:
+        k = k.copy()
+
     if over and under:
         return _over_and_under_closure(k, A, B, arcs)
     if over:
@@ -11,11 +11,9 @@ __all__ = ["number_of_link_components", "link_components_endpoints"]
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek"
 
-from itertools import combinations
-
 from knotpy.classes.planardiagram import Diagram
 from knotpy.classes.node import Crossing
-from knotpy.utils.disjoint_union_set import DisjointSetUnion
+from knotpy.utils.disjoint_union_set import _uf_find, _uf_union
 
 
 def number_of_link_components(k: Diagram) -> int:
@@ -24,7 +22,47 @@ def number_of_link_components(k: Diagram) -> int:
     For example, a trefoil knot has 1 component, while the Hopf link
     has 2 components.
     """
-    return len(list(link_components_endpoints(k)))
+    _, parent = _endpoints_union_find(k)
+    # each component has exactly one root
+    return sum(1 for i, p in enumerate(parent) if i == p)
+
+
+def _endpoints_union_find(k: Diagram) -> tuple[dict, list[int]]:
+    """Build the union-find forest of endpoints lying on the same link component.
+
+    The endpoint at (node, position) is identified by the integer ``offset[node] + position``.
+
+    Returns:
+        The node offsets and the parent array of the forest.
+    """
+    nodes = k._nodes
+
+    offset = {}
+    n = 0
+    for node, inst in nodes.items():
+        offset[node] = n
+        n += len(inst)
+
+    parent = list(range(n))
+    rank = bytearray(n)
+
+    for node, inst in nodes.items():
+        i = offset[node]
+
+        # endpoints from arcs are on the same component
+        for pos, adj_ep in enumerate(inst):
+            _uf_union(parent, rank, i + pos, offset[adj_ep.node] + adj_ep.position)
+
+        # endpoints from crossings and other nodes
+        if isinstance(inst, Crossing):
+            _uf_union(parent, rank, i, i + 2)
+            _uf_union(parent, rank, i + 1, i + 3)
+        else:
+            # a star of unions to the first endpoint joins all of them
+            for pos in range(1, len(inst)):
+                _uf_union(parent, rank, i, i + pos)
+
+    return offset, parent
 
 
 def link_components_endpoints(k: Diagram) -> list[set]:
@@ -33,22 +71,19 @@ def link_components_endpoints(k: Diagram) -> list[set]:
     Endpoints are grouped into the same component if they are connected
     through arcs or at nodes in the diagram.
     """
-    dsu = DisjointSetUnion(k.endpoints)
+    nodes = k._nodes
+    offset, parent = _endpoints_union_find(k)
 
-    # endpoints from arcs are on the same component
-    for ep1, ep2 in k.arcs:
-        dsu[ep1] = ep2
+    # bucket the endpoints by their root, ordered by first appearance
+    components = {}
+    for node, inst in nodes.items():
+        i = offset[node]
+        for pos, adj_ep in enumerate(inst):
+            ep = nodes[adj_ep.node]._inc[adj_ep.position]
+            components.setdefault(_uf_find(parent, i + pos), set()).add(ep)
 
-    # endpoints from crossings and other nodes
-    for node, obj in k.nodes.items():
-        if isinstance(obj, Crossing):
-            dsu[obj[0]] = obj[2]
-            dsu[obj[1]] = obj[3]
-        else:
-            for ep0, ep1 in combinations(obj, r=2):
-                dsu[ep0] = ep1
+    return list(components.values())
 
-    return list(dsu)
 
 def enumerate_link_components(k: Diagram, keyword="component", start=0, inplace=False) -> Diagram:
     """Mark link components in a diagram."""
@@ -91,21 +91,17 @@ def contract_arc(
     k.remove_arc((keep_ep, drop_ep))
 
     # Pull all other endpoints incident to drop_node, one-by-one, into keep_node @ keep_pos.
-    # We iterate by decreasing the index relative to drop_pos, letting the node shrink as we pull.
-    drop_node_inst = k.nodes[drop_node]
-    idx = drop_pos
-    while drop_node_inst:  # while there remain incident endpoints
-        idx -= 1
-        src_pos = max(idx, -1) % len(drop_node_inst)
+    # We walk backwards from drop_pos and then take the last endpoint, as the node shrinks by one per pull.
+    degree = len(k.nodes[drop_node])
+    for step in range(degree):
+        src_pos = drop_pos - 1 - step
+        if src_pos < 0:
+            src_pos = degree - 1 - step
         pull_and_plug_endpoint(
             k,
             source_endpoint=(drop_node, src_pos),
             destination_endpoint=(keep_node, keep_pos),
         )
-        # node object is updated by pull_and_plug_endpoint through k; refresh reference
-        drop_node_inst = k.nodes.get(drop_node, None)
-        if drop_node_inst is None:
-            break
 
     # Finally remove the emptied node container (endpoints already unplugged)
     if drop_node in k.nodes:
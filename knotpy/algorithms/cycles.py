@@ -29,43 +29,35 @@ def cycles(g: PlanarDiagram, n: int) -> set[tuple]:
     if n < 1:
         raise ValueError("Length must be at least 1")
 
-    # Precompute neighbors (by node only; ignore endpoint positions)
-    neighbors: dict = {v: [adj.node for adj in g.nodes[v]] for v in g.nodes}
+    # Index the nodes in sorted order and precompute neighbors (by node only; ignore endpoint positions)
+    nodes = sorted(g.nodes)
+    index = {v: i for i, v in enumerate(nodes)}
+    neighbors = [tuple(dict.fromkeys(index[adj.node] for adj in g.nodes[v])) for v in nodes]
+    neighbors_mask = [sum(1 << u for u in nbrs) for nbrs in neighbors]
 
     found: set[tuple] = set()
+    path = [0] * n  # reused in place, visited nodes are kept as a bitmask
 
-    def dfs(path: list, visited: set) -> None:
-        curr = path[-1]
-        start = path[0]
-
-        if len(path) == n:
-            # close the cycle if there is an edge back to start
-            if start in neighbors[curr]:
-                can = _min_lex_rotation(tuple(path))
-                found.add(can)
+    def dfs(curr: int, depth: int, visited: int) -> None:
+        if depth == n:
+            # close the cycle if there is an edge back to start, and keep only the smaller of the two directions
+            if neighbors_mask[curr] >> start & 1 and (n < 3 or path[1] < path[-1]):
+                found.add(tuple(nodes[i] for i in path))
             return
 
         for nb in neighbors[curr]:
-            if nb in visited:
+            # the start is the smallest node of the cycle, which fixes the rotation
+            if nb < start or visited >> nb & 1:
                 continue
-            dfs(path + [nb], visited | {nb})
+            path[depth] = nb
+            dfs(nb, depth + 1, visited | 1 << nb)
 
-    for v in g.nodes:
-        dfs([v], {v})
+    for start in range(len(nodes)):
+        path[0] = start
+        dfs(start, 1, 1 << start)
 
     return found
 
 
-def _min_lex_rotation(cycle: tuple) -> tuple:
-    """
-    Canonical representative of a cycle under rotation and reversal.
-    """
-    L = len(cycle)
-    rots = [cycle[i:] + cycle[:i] for i in range(L)]
-    rev = tuple(reversed(cycle))
-    rev_rots = [rev[i:] + rev[:i] for i in range(L)]
-    return min(rots + rev_rots)
-
-
 if __name__ == "__main__":
-    pass
\ No newline at end of file
+    pass
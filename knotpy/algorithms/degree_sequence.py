@@ -9,7 +9,6 @@ __version__ = "1.0"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
 from knotpy.classes.planardiagram import PlanarDiagram
-from knotpy.utils.set_utils import LeveledSet
 
 
 def degree_sequence(k: PlanarDiagram) -> tuple[int, ...]:
@@ -22,7 +21,7 @@ def degree_sequence(k: PlanarDiagram) -> tuple[int, ...]:
     Returns:
         Tuple of node degrees in nondecreasing order.
     """
-    return tuple(sorted(k.degree(v) for v in k.nodes))
+    return tuple(sorted(len(inst) for inst in k._nodes.values()))
 
 
 def neighbour_sequence(k: PlanarDiagram, node) -> tuple[int, ...]:
@@ -38,7 +37,7 @@ def neighbour_sequence(k: PlanarDiagram, node) -> tuple[int, ...]:
 
     Returns:
         Tuple where the i-th entry is the number of nodes at distance i from
-        ``node`` (i ≥ 1). The 0-th layer (the start) is not included.
+        ``node``. The 0-th entry (the start itself) is always 1.
 
     Raises:
         KeyError: If ``node`` is not present in the diagram.
@@ -46,15 +45,24 @@ def neighbour_sequence(k: PlanarDiagram, node) -> tuple[int, ...]:
     if node not in k.nodes:
         raise KeyError(f"Node {node!r} not found in the diagram.")
 
-    seq = LeveledSet([node])
-
-    # Build successive BFS layers until the last layer is empty.
-    while not seq.is_level_empty(-1):
-        seq.new_level()
-        seq.extend(ep.node for v in seq.iter_level(-2) for ep in k.nodes[v])
-
-    # Drop the last (empty) layer count.
-    return seq.level_sizes()[:-1]
+    nodes = k._nodes
+    visited = {node}
+    frontier = [node]
+    sizes = [1]
+
+    # Build successive BFS layers until no new nodes appear.
+    while True:
+        layer = []
+        for v in frontier:
+            for ep in nodes[v]:
+                u = ep.node
+                if u not in visited:
+                    visited.add(u)
+                    layer.append(u)
+        if not layer:
+            return tuple(sizes)
+        sizes.append(len(layer))
+        frontier = layer
 
 
 if __name__ == "__main__":
@@ -17,12 +17,10 @@ __all__ = [
 __version__ = "0.3"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
-from itertools import permutations
-
-from knotpy.algorithms.naming import unique_new_node_name, generate_node_names
+from knotpy.algorithms.naming import multiple_unique_new_node_names, generate_node_names
 from knotpy.classes.endpoint import Endpoint, IngoingEndpoint, OutgoingEndpoint
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
-from knotpy.utils.disjoint_union_set import DisjointSetUnion
+from knotpy.utils.disjoint_union_set import _uf_find, _uf_union
 
 
 def add_unknot(k: PlanarDiagram, number_of_unknots: int = 1, inplace: bool = True) -> PlanarDiagram:
@@ -44,13 +42,14 @@ def add_unknot(k: PlanarDiagram, number_of_unknots: int = 1, inplace: bool = Tru
         k = k.copy()
 
     oriented = k.is_oriented()
+    in_type = IngoingEndpoint if oriented else Endpoint
+    out_type = OutgoingEndpoint if oriented else Endpoint
 
-    for _ in range(number_of_unknots):
-        node = unique_new_node_name(k)
+    for node in multiple_unique_new_node_names(k, number_of_unknots):
         k.add_vertex(node, degree=2)
         # connect the two endpoints of the same vertex
-        k.set_endpoint((node, 0), (node, 1), create_using=(IngoingEndpoint if oriented else Endpoint))
-        k.set_endpoint((node, 1), (node, 0), create_using=(OutgoingEndpoint if oriented else Endpoint))
+        k.set_endpoint((node, 0), (node, 1), create_using=in_type)
+        k.set_endpoint((node, 1), (node, 0), create_using=out_type)
 
     return k
 
@@ -65,10 +64,24 @@ def _disjoint_components_nodes(k: PlanarDiagram) -> list[set]:
     Returns:
         List of node-sets, one per connected component.
     """
-    dsu = DisjointSetUnion(k.nodes)
-    for ep0, ep1 in k.arcs:
-        dsu[ep0.node] = ep1.node
-    return list(dsu.classes())
+    nodes = k._nodes
+    ids = {node: i for i, node in enumerate(nodes)}
+    parent = list(range(len(ids)))
+    rank = bytearray(len(ids))
+
+    for node, inst in nodes.items():
+        i = ids[node]
+        for ep in inst:
+            # every arc is seen from both of its ends, union it once (loops need no union)
+            j = ids[ep.node]
+            if j > i:
+                _uf_union(parent, rank, i, j)
+
+    # bucket the nodes by their root, ordered by first appearance
+    components = {}
+    for node, i in ids.items():
+        components.setdefault(_uf_find(parent, i), set()).add(node)
+    return list(components.values())
 
 
 def number_of_disjoint_components(k: PlanarDiagram) -> int:
@@ -114,16 +127,43 @@ def disjoint_union_decomposition(k: PlanarDiagram) -> list[PlanarDiagram]:
     Returns:
         List of component diagrams.
     """
-    components: list[PlanarDiagram] = []
+    return _components_from_node_sets(k, _disjoint_components_nodes(k))
+
+
+def _components_from_node_sets(k: PlanarDiagram, components_nodes: list[set]) -> list[PlanarDiagram]:
+    """
+    Split a diagram into components given by precomputed node-sets (see ``disjoint_union_decomposition``).
 
+    Args:
+        k: Diagram to decompose.
+        components_nodes: Node-sets of the connected components, as returned by ``_disjoint_components_nodes``.
+
+    Returns:
+        List of component diagrams.
+    """
     # Sort deterministically by node-name signature to avoid non-orderable sets
-    for comp_nodes in sorted(_disjoint_components_nodes(k), key=lambda s: tuple(sorted(s))):
-        g = k.copy()
-        if "name" in g.attr:
-            del g.attr["name"]
-        # Removing all nodes not in this component (incident endpoints fall out)
-        g.remove_nodes_from(set(g.nodes) - set(comp_nodes), remove_incident_endpoints=False)
+    components_nodes = sorted(components_nodes, key=lambda s: tuple(sorted(s)))
+
+    components: list[PlanarDiagram] = []
+    node_component: dict = {}
+    for comp_nodes in components_nodes:
+        g = type(k)()
+        g.attr.update(k.attr)
+        g.attr.pop("name", None)
         components.append(g)
+        node_component.update(dict.fromkeys(comp_nodes, g))
+
+    # Build all components in a single pass over the nodes (keeping their order)
+    for node, inst in k.nodes.items():
+        g = node_component[node]
+        g.add_node(node_for_adding=node, create_using=type(inst), degree=len(inst), **inst.attr)
+        for pos, adj_ep in enumerate(inst):
+            g.set_endpoint(
+                endpoint_for_setting=(node, pos),
+                adjacent_endpoint=(adj_ep.node, adj_ep.position),
+                create_using=type(adj_ep),
+                **adj_ep.attr,
+            )
 
     # Put framing only on the first component (if present)
     if components and k.framing is not None:
@@ -170,33 +210,29 @@ def disjoint_union(*knots: PlanarDiagram | OrientedPlanarDiagram, return_relabel
     if any(k.framing is not None for k in knots):
         new_knot.framing = sum(k.framing or 0 for k in knots)
 
-    relabel_dicts: list[dict] = []
+    # the per-diagram relabelings are only kept if they are returned
+    relabel_dicts: list[dict] | None = [] if return_relabel_dicts else None
+
+    add_node = new_knot.add_node
+    set_endpoint = new_knot.set_endpoint
 
     for k in knots:
         new_knot.attr.update(k.attr)
 
-        relabel = {}
-        relabel_dicts.append(relabel)
+        # relabel first, so each node and all of its endpoints are created in a single pass
+        relabel = dict(zip(k.nodes, new_name_iter))
+        if relabel_dicts is not None:
+            relabel_dicts.append(relabel)
 
-        # create nodes
         for node, inst in k.nodes.items():
-            new_name = next(new_name_iter)
-            relabel[node] = new_name
-            new_knot.add_node(
-                node_for_adding=new_name,
-                create_using=type(inst),
-                degree=len(inst),
-                **inst.attr,
-            )
-
-        # create arcs
-        for arc in k.arcs:
-            for ep1, ep2 in permutations(arc):
-                new_knot.set_endpoint(
-                    endpoint_for_setting=(relabel[ep1.node], ep1.position),
-                    adjacent_endpoint=(relabel[ep2.node], ep2.position),
-                    create_using=type(ep2),
-                    **ep2.attr,
+            new_node = relabel[node]
+            add_node(node_for_adding=new_node, create_using=type(inst), degree=len(inst), **inst.attr)
+            for pos, adj_ep in enumerate(inst):
+                set_endpoint(
+                    endpoint_for_setting=(new_node, pos),
+                    adjacent_endpoint=(relabel[adj_ep.node], adj_ep.position),
+                    create_using=type(adj_ep),
+                    **adj_ep.attr,
                 )
 
     return (new_knot, relabel_dicts) if return_relabel_dicts else new_knot
@@ -35,13 +35,16 @@ def dual_planar_diagram(k: PlanarDiagram) -> PlanarDiagram:
         True
     """
     dual = PlanarDiagram()
-    faces = list(k.faces)  # each face is an ordered list/tuple of endpoints
-
-    # Make faces hashable/iterable labels
+    # Make faces (ordered sequences of endpoints) hashable/iterable labels
     faces = [tuple(face) for face in k.faces]
 
-    # Map each endpoint to its face (tuple)
-    ep_face_dict = {ep: f for f in faces for ep in f}
+    # Map each endpoint to its face (tuple) and to its position in that face
+    ep_face_dict = {}
+    ep_pos_dict = {}
+    for f in faces:
+        for pos, ep in enumerate(f):
+            ep_face_dict[ep] = f
+            ep_pos_dict[ep] = pos
 
     # Use the face tuples as node labels in the dual
     dual.add_nodes_from(faces, create_using=Vertex)
@@ -49,10 +52,8 @@ def dual_planar_diagram(k: PlanarDiagram) -> PlanarDiagram:
     for face in faces:
         for pos, ep in enumerate(face):
             twin = k.twin(ep)
-            adj_face = ep_face_dict[twin]  # this is a face tuple
-            adj_pos = adj_face.index(twin)  # tuple.index works
             dual.set_endpoint(endpoint_for_setting=(face, pos),
-                              adjacent_endpoint=(adj_face, adj_pos))
+                              adjacent_endpoint=(ep_face_dict[twin], ep_pos_dict[twin]))
 
     if getattr(k, "name", None):
         dual.name = f"{k.name}^*"
@@ -78,12 +79,16 @@ def arc_face_graph(k: PlanarDiagram) -> dict:
     arcs_near_arcs: dict = {arc: set() for arc in k.arcs}
 
     for face in faces:
-        # every pair of endpoints on a face determines two arcs; connect their arcs
-        for ep1, ep2 in combinations(face, 2):
-            arc1 = k.arcs[ep1]
-            arc2 = k.arcs[ep2]
-            if arc1 is arc2:
-                continue
+        # collect the distinct arcs on the face (an arc met twice is adjacent to itself)
+        face_arcs = {}
+        for ep in face:
+            arc = k.arcs[ep]
+            if arc in face_arcs:
+                arcs_near_arcs[arc].add(arc)
+            face_arcs[arc] = None
+
+        # connect every pair of distinct arcs on the face
+        for arc1, arc2 in combinations(face_arcs, 2):
             arcs_near_arcs[arc1].add(arc2)
             arcs_near_arcs[arc2].add(arc1)
 
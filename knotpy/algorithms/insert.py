@@ -181,11 +181,41 @@ def parallelize_arc(k: PlanarDiagram, arc: tuple[tuple, tuple], inplace=True, **
         raise ValueError("Can only parallelize arcs between Vertex nodes.")
 
     # Insert a new arc adjacent to the first endpoint (at pos_a+1)
-    insert_arc(k, ((node_a, pos_a + 1), (node_b, pos_b)), **attr)
+    _splice_parallel(k, node_a, pos_a + 1, node_b, pos_b, **attr)
 
     return k
 
 
+def _splice_parallel(k: PlanarDiagram, node_a, pos_a: int, node_b, pos_b: int, **attr) -> None:
+    """Internal: insert an arc between ``(node_a, pos_a)`` and ``(node_b, pos_b)`` of two distinct nodes.
+
+    Equivalent to ``insert_arc``, but both incidence lists are shifted at once, so the partners of the
+    endpoints following the new arc are rewritten in a single pass.
+    """
+    nodes = k._nodes
+    inc_a = nodes[node_a]._inc
+    inc_b = nodes[node_b]._inc
+
+    # endpoints that move one position CCW, given by their (old) positions and the partners they point to
+    tail = [(node_a, i, ep) for i, ep in enumerate(inc_a[pos_a:], start=pos_a)]
+    tail += [(node_b, i, ep) for i, ep in enumerate(inc_b[pos_b:], start=pos_b)]
+
+    inc_a.insert(pos_a, None)
+    inc_b.insert(pos_b, None)
+
+    for node, i, adj_ep in tail:
+        adj_node, adj_pos = adj_ep.node, adj_ep.position
+        if (adj_node == node_a and adj_pos >= pos_a) or (adj_node == node_b and adj_pos >= pos_b):
+            adj_pos += 1
+        adj_inc = nodes[adj_node]._inc
+        ep_target = adj_inc[adj_pos]
+        adj_inc[adj_pos] = type(ep_target)(node=node, position=i + 1, **ep_target.attr)
+
+    is_oriented = k.is_oriented()
+    inc_a[pos_a] = (IngoingEndpoint if is_oriented else Endpoint)(node_b, pos_b, **attr)
+    inc_b[pos_b] = (OutgoingEndpoint if is_oriented else Endpoint)(node_a, pos_a, **attr)
+
+
 def _insert_none_at_node_position(k: PlanarDiagram, node, position: int, count: int = 1) -> None:
     """Internal: insert ``count`` placeholders at a node position and shift others.
 
@@ -198,21 +228,18 @@ def _insert_none_at_node_position(k: PlanarDiagram, node, position: int, count:
         position: Insertion position.
         count: How many placeholders to insert.
     """
-    node_inst = k.nodes[node]
-
-    # Record all adjustments we need to make on the *other* endpoints first.
-    changes: list[tuple] = []
-    for i, adj_ep in enumerate(node_inst[position:], start=position):
-        ep_target = k.endpoint_from_pair((node, i))
-        changes.append((adj_ep.node, adj_ep.position, i + count, type(ep_target), ep_target.attr))
+    nodes = k._nodes
+    inc = nodes[node]._inc
 
-    # Apply the recorded changes: shift the partners so they still point to us
-    for adj_node, adj_pos, new_pos, ep_type, ep_attr in changes:
-        k.nodes[adj_node][adj_pos] = ep_type(node=node, position=new_pos, **ep_attr)
+    # Shift the partners of the trailing endpoints so they still point to us. The tail is a copy, so
+    # rewriting partners at this same node (loops) does not affect the iteration.
+    for i, adj_ep in enumerate(inc[position:], start=position):
+        adj_inc = nodes[adj_ep.node]._inc
+        ep_target = adj_inc[adj_ep.position]
+        adj_inc[adj_ep.position] = type(ep_target)(node=node, position=i + count, **ep_target.attr)
 
     # Finally insert ``None`` slots at this node
-    for i in range(count):
-        k._nodes[node]._inc.insert(position + i, None)
+    inc[position:position] = [None] * count
 
 
 if __name__ == "__main__":
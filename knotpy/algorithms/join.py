@@ -13,7 +13,7 @@ from knotpy.classes.endpoint import Endpoint, IngoingEndpoint, OutgoingEndpoint,
 from knotpy.classes.node import Vertex, Crossing
 from knotpy.classes.planardiagram import Diagram, PlanarDiagram, OrientedPlanarDiagram
 from knotpy.algorithms.disjoint_union import disjoint_union
-from knotpy.algorithms.naming import unique_new_node_name
+from knotpy.algorithms.naming import unique_new_node_name, multiple_unique_new_node_names
 
 
 
@@ -53,37 +53,36 @@ def bridge_join(a: Diagram, b: Diagram, arcs: tuple | None) -> Diagram:
     ab, relabel_dicts = disjoint_union(a, b, return_relabel_dicts=True)
     map_a, map_b = relabel_dicts
 
-    def relabel_from_a(ep: Endpoint) -> tuple:
-        return map_a[ep.node], ep.position
-
-    def relabel_from_b(ep: Endpoint) -> tuple:
-        return map_b[ep.node], ep.position
+    # relabeled positions of the arc ends in the joined diagram
+    a_1, a_2 = (map_a[ep_a_1.node], ep_a_1.position), (map_a[ep_a_2.node], ep_a_2.position)
+    b_1, b_2 = (map_b[ep_b_1.node], ep_b_1.position), (map_b[ep_b_2.node], ep_b_2.position)
 
     # internal bridge vertices
-    va = unique_new_node_name(ab)
-    vb = unique_new_node_name(ab)
+    va, vb = multiple_unique_new_node_names(ab, 2)
     ab.add_node(node_for_adding=va, create_using=Vertex, degree=3)
     ab.add_node(node_for_adding=vb, create_using=Vertex, degree=3)
+    va_0, va_1, va_2 = (va, 0), (va, 1), (va, 2)
+    vb_0, vb_1, vb_2 = (vb, 0), (vb, 1), (vb, 2)
 
     # connect A's arc to va
-    ab.set_endpoint((va, 0), relabel_from_a(ep_a_1), create_using=type(ep_a_1), **ep_a_1.attr)
-    ab.set_endpoint(relabel_from_a(ep_a_1), (va, 0), create_using=type(ep_a_2), **ep_a_2.attr)
-    ab.set_endpoint((va, 1), relabel_from_a(ep_a_2), create_using=type(ep_a_2), **ep_a_2.attr)
-    ab.set_endpoint(relabel_from_a(ep_a_2), (va, 1), create_using=type(ep_a_1), **ep_a_1.attr)
+    ab.set_endpoint(va_0, a_1, create_using=type(ep_a_1), **ep_a_1.attr)
+    ab.set_endpoint(a_1, va_0, create_using=type(ep_a_2), **ep_a_2.attr)
+    ab.set_endpoint(va_1, a_2, create_using=type(ep_a_2), **ep_a_2.attr)
+    ab.set_endpoint(a_2, va_1, create_using=type(ep_a_1), **ep_a_1.attr)
 
     # connect B's arc to vb
-    ab.set_endpoint((vb, 0), relabel_from_b(ep_b_1), create_using=type(ep_b_1), **ep_b_1.attr)
-    ab.set_endpoint(relabel_from_b(ep_b_1), (vb, 0), create_using=type(ep_b_2), **ep_b_2.attr)
-    ab.set_endpoint((vb, 1), relabel_from_b(ep_b_2), create_using=type(ep_b_2), **ep_b_2.attr)
-    ab.set_endpoint(relabel_from_b(ep_b_2), (vb, 1), create_using=type(ep_b_1), **ep_b_1.attr)
+    ab.set_endpoint(vb_0, b_1, create_using=type(ep_b_1), **ep_b_1.attr)
+    ab.set_endpoint(b_1, vb_0, create_using=type(ep_b_2), **ep_b_2.attr)
+    ab.set_endpoint(vb_1, b_2, create_using=type(ep_b_2), **ep_b_2.attr)
+    ab.set_endpoint(b_2, vb_1, create_using=type(ep_b_1), **ep_b_1.attr)
 
     # bridge between va and vb (respect orientation if present)
     is_oriented = ab.is_oriented()
     typ_in = IngoingEndpoint if is_oriented else Endpoint
     typ_out = OutgoingEndpoint if is_oriented else Endpoint
 
-    ab.set_endpoint((va, 2), (vb, 2), create_using=typ_in)
-    ab.set_endpoint((vb, 2), (va, 2), create_using=typ_out)
+    ab.set_endpoint(va_2, vb_2, create_using=typ_in)
+    ab.set_endpoint(vb_2, va_2, create_using=typ_out)
 
     # framing
     if a.framing is not None or b.framing is not None:
@@ -123,12 +122,6 @@ def crossing_join(a: Diagram, b: Diagram, arcs: tuple | None) -> Diagram:
     ab, relabel_dicts = disjoint_union(a, b, return_relabel_dicts=True)
     map_a, map_b = relabel_dicts
 
-    def relabel_from_a(ep: Endpoint) -> tuple:
-        return map_a[ep.node], ep.position
-
-    def relabel_from_b(ep: Endpoint) -> tuple:
-        return map_b[ep.node], ep.position
-
     # add the crossing
     c = unique_new_node_name(ab)
     ab.add_crossing(crossing_for_adding=c)
@@ -137,17 +130,21 @@ def crossing_join(a: Diagram, b: Diagram, arcs: tuple | None) -> Diagram:
     if ab.is_oriented() and (type(ep_a_1) == type(ep_b_1)):  # both ingoing or both outgoing → flip B
         ep_b_1, ep_b_2 = ep_b_2, ep_b_1
 
+    # relabeled positions of the arc ends in the joined diagram
+    a_1, a_2 = (map_a[ep_a_1.node], ep_a_1.position), (map_a[ep_a_2.node], ep_a_2.position)
+    b_1, b_2 = (map_b[ep_b_1.node], ep_b_1.position), (map_b[ep_b_2.node], ep_b_2.position)
+
     # connect crossing half-edges: (0,1) for arc_a; (2,3) for arc_b
-    ab.set_endpoint((c, 0), relabel_from_a(ep_a_1), create_using=type(ep_a_1), **ep_a_1.attr)
-    ab.set_endpoint(relabel_from_a(ep_a_1), (c, 0), create_using=type(ep_a_2), **ep_a_2.attr)
+    ab.set_endpoint((c, 0), a_1, create_using=type(ep_a_1), **ep_a_1.attr)
+    ab.set_endpoint(a_1, (c, 0), create_using=type(ep_a_2), **ep_a_2.attr)
 
-    ab.set_endpoint((c, 1), relabel_from_a(ep_a_2), create_using=type(ep_a_2), **ep_a_2.attr)
-    ab.set_endpoint(relabel_from_a(ep_a_2), (c, 1), create_using=type(ep_a_1), **ep_a_1.attr)
+    ab.set_endpoint((c, 1), a_2, create_using=type(ep_a_2), **ep_a_2.attr)
+    ab.set_endpoint(a_2, (c, 1), create_using=type(ep_a_1), **ep_a_1.attr)
 
-    ab.set_endpoint((c, 2), relabel_from_b(ep_b_1), create_using=type(ep_b_1), **ep_b_1.attr)
-    ab.set_endpoint(relabel_from_b(ep_b_1), (c, 2), create_using=type(ep_b_2), **ep_b_2.attr)
+    ab.set_endpoint((c, 2), b_1, create_using=type(ep_b_1), **ep_b_1.attr)
+    ab.set_endpoint(b_1, (c, 2), create_using=type(ep_b_2), **ep_b_2.attr)
 
-    ab.set_endpoint((c, 3), relabel_from_b(ep_b_2), create_using=type(ep_b_2), **ep_b_2.attr)
-    ab.set_endpoint(relabel_from_b(ep_b_2), (c, 3), create_using=type(ep_b_1), **ep_b_1.attr)
+    ab.set_endpoint((c, 3), b_2, create_using=type(ep_b_2), **ep_b_2.attr)
+    ab.set_endpoint(b_2, (c, 3), create_using=type(ep_b_1), **ep_b_1.attr)
 
     return ab
\ No newline at end of file
@@ -12,17 +12,38 @@ __version__ = "1.0"
 __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 
 import string
+from bisect import bisect_right
+from itertools import chain, count, islice, product
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
 
 _BASE = len(string.ascii_letters)
-_REVERSE = {ch: i for i, ch in enumerate(string.ascii_letters)}
+# _REVERSE[code] is the index of the ASCII letter with the given code point (255 for other characters)
+_REVERSE = bytes(string.ascii_letters.find(chr(code)) % 256 for code in range(128))
+# maps the letters to characters whose code points follow the a, ..., z, A, ..., Z order
+_ORDER_TABLE = str.maketrans(string.ascii_letters, "".join(chr(0x100 + i) for i in range(_BASE)))
+# _OFFSETS[length] is the number of names shorter than or equal to ``length`` (extended on demand)
+_OFFSETS = [0]
+
+
+def _extend_offsets(length: int) -> None:
+    """Extend ``_OFFSETS`` to cover names of the given length."""
+    while len(_OFFSETS) <= length:
+        _OFFSETS.append(_OFFSETS[-1] + _BASE ** len(_OFFSETS))
+
+
+_extend_offsets(8)
 
 
 def generate_node_names(number_of_nodes: int) -> list[str]:
     """Generate `number_of_nodes` alphabetic node names (a, b, ..., Z, aa, ab, ...)."""
     if number_of_nodes < 0:
         raise ValueError("number_of_nodes must be non-negative.")
-    return [number_to_alpha(i) for i in range(number_of_nodes)]
+
+    # the names of each length follow in the lexicographic order of letter tuples
+    names = chain.from_iterable(
+        map("".join, product(string.ascii_letters, repeat=length)) for length in count(1)
+    )
+    return list(islice(names, number_of_nodes))
 
 
 def _is_alpha(s) -> bool:
@@ -36,11 +57,12 @@ def _alpha_to_number(s: str) -> int:
         raise ValueError(f"Invalid alphabetic name: {s!r}")
 
     idx = 0
-    for ch in s:
-        idx = idx * _BASE + _REVERSE[ch]
+    for code in s.encode("ascii"):
+        idx = idx * _BASE + _REVERSE[code]
 
-    offset = sum(_BASE**i for i in range(1, len(s))) if len(s) > 1 else 0
-    return idx + offset
+    if len(s) >= len(_OFFSETS):
+        _extend_offsets(len(s))
+    return idx + _OFFSETS[len(s) - 1]
 
 
 def number_to_alpha(n: int) -> str:
@@ -48,13 +70,10 @@ def number_to_alpha(n: int) -> str:
     if n < 0:
         raise ValueError("n must be non-negative.")
 
-    length = 1
-    total = _BASE
-    remaining = n
-    while remaining >= total:
-        remaining -= total
-        length += 1
-        total = _BASE**length
+    while n >= _OFFSETS[-1]:
+        _extend_offsets(len(_OFFSETS))
+    length = bisect_right(_OFFSETS, n)
+    remaining = n - _OFFSETS[length - 1]
 
     chars: list[str] = []
     for _ in range(length):
@@ -63,21 +82,46 @@ def number_to_alpha(n: int) -> str:
     return "".join(reversed(chars))
 
 
+def _alpha_key(s: str) -> tuple[int, str]:
+    """Sort key of an alphabetic name that agrees with its sequence number (see ``_alpha_to_number``)."""
+    return len(s), s.translate(_ORDER_TABLE)
+
+
+def _next_node_number(nodes) -> tuple[bool, int]:
+    """Scan the node names once and return whether they are all integers, together with the next free number.
+
+    The next free number is the largest integer name plus one if all names are integers, otherwise the
+    sequence number following the largest alphabetic name (0 if there is none). Alphabetic names are
+    compared by ``_alpha_key``, only the largest one is converted to a number.
+    """
+    all_int = True
+    max_int = None
+    max_alpha = None
+    max_alpha_key = None
+    for node in nodes:
+        if isinstance(node, int):
+            if all_int and (max_int is None or node > max_int):
+                max_int = node
+            continue
+        all_int = False
+        if _is_alpha(node):
+            key = _alpha_key(node)
+            if max_alpha_key is None or key > max_alpha_key:
+                max_alpha, max_alpha_key = node, key
+
+    if all_int:
+        return True, max_int + 1
+    return False, 0 if max_alpha is None else _alpha_to_number(max_alpha) + 1
+
+
 def unique_new_node_name(k: PlanarDiagram | OrientedPlanarDiagram) -> str | int:
     """Return the next available node name for the diagram."""
     nodes = getattr(k, "nodes", [])
     if not nodes:
         return number_to_alpha(0)
 
-    if all(isinstance(node, int) for node in nodes):
-        return max(nodes) + 1
-
-    alpha_nodes = [node for node in nodes if _is_alpha(node)]
-    if not alpha_nodes:
-        return number_to_alpha(0)
-
-    max_num = max(_alpha_to_number(node) for node in alpha_nodes)
-    return number_to_alpha(max_num + 1)
+    all_int, number = _next_node_number(nodes)
+    return number if all_int else number_to_alpha(number)
 
 
 def multiple_unique_new_node_names(k: PlanarDiagram | OrientedPlanarDiagram, count: int) -> list[str] | list[int]:
@@ -89,16 +133,10 @@ def multiple_unique_new_node_names(k: PlanarDiagram | OrientedPlanarDiagram, cou
     if not nodes:
         return [number_to_alpha(i) for i in range(count)]
 
-    if all(isinstance(node, int) for node in nodes):
-        start = max(nodes) + 1
+    all_int, start = _next_node_number(nodes)
+    if all_int:
         return [start + i for i in range(count)]
-
-    alpha_nodes = [node for node in nodes if _is_alpha(node)]
-    if not alpha_nodes:
-        return [number_to_alpha(i) for i in range(count)]
-
-    start_num = max(_alpha_to_number(node) for node in alpha_nodes) + 1
-    return [number_to_alpha(start_num + i) for i in range(count)]
+    return [number_to_alpha(start + i) for i in range(count)]
 
 
 if __name__ == "__main__":
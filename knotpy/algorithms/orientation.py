@@ -14,6 +14,12 @@ from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
 from knotpy.classes.endpoint import Endpoint, IngoingEndpoint, OutgoingEndpoint
 from knotpy.algorithms.topology import edges as compute_edges
 
+_REVERSED_ENDPOINT_TYPE = {
+    Endpoint: Endpoint,
+    IngoingEndpoint: OutgoingEndpoint,
+    OutgoingEndpoint: IngoingEndpoint,
+}
+
 
 def orient_edges(k: PlanarDiagram, edge_paths: list[list[Endpoint]]) -> OrientedPlanarDiagram:
     """Orient an unoriented diagram along given edge paths.
@@ -103,14 +109,26 @@ def orientations(k: PlanarDiagram, up_to_reversal: bool = False) -> list[Oriente
 
     if up_to_reversal:
         # fix first edge to True, vary the rest
-        flip_choices = [(True,) + rest for rest in it.product((True, False), repeat=m - 1)]
+        flip_choices = it.product((True,), *[(True, False)] * (m - 1))
     else:
-        flip_choices = list(it.product((True, False), repeat=m))
+        flip_choices = it.product((True, False), repeat=m)
+
+    # Reversing an edge keeps its (ep, twin) pairs and their attributes, and only swaps which side of each
+    # pair is outgoing, so the pairs are computed once and every orientation is written directly.
+    edge_pairs = [list(zip(e[::2], e[1::2])) for e in edge_list]
 
     results: list[OrientedPlanarDiagram] = []
     for choice in flip_choices:
-        oriented_paths = [e if keep else e[::-1] for e, keep in zip(edge_list, choice)]
-        ok = orient_edges(k, oriented_paths)
+        ok = OrientedPlanarDiagram(**k.attr)
+        for node, inst in k.nodes.items():
+            ok.add_node(node_for_adding=node, create_using=type(inst), degree=len(inst), **inst.attr)
+
+        nodes = ok._nodes
+        for pairs, keep in zip(edge_pairs, choice):
+            ep_type, twin_type = (OutgoingEndpoint, IngoingEndpoint) if keep else (IngoingEndpoint, OutgoingEndpoint)
+            for ep, twin_ep in pairs:
+                nodes[ep.node]._inc[ep.position] = ep_type(twin_ep.node, twin_ep.position, **ep.attr)
+                nodes[twin_ep.node]._inc[twin_ep.position] = twin_type(ep.node, ep.position, **twin_ep.attr)
 
         if k.name:
             suffix = "".join("+" if keep else "-" for keep in choice)
@@ -162,20 +180,12 @@ def reverse(k: OrientedPlanarDiagram, inplace: bool = False) -> OrientedPlanarDi
     if not inplace:
         k = k.copy()
 
-    # Rewrite all arcs with reversed endpoint types.
-    for ep1, ep2 in list(k.arcs):
-        k.set_endpoint(
-            endpoint_for_setting=(ep1.node, ep1.position),
-            adjacent_endpoint=(ep2.node, ep2.position),
-            create_using=type(ep2).reverse_type(),
-            **k.nodes[ep2.node].attr,
-        )
-        k.set_endpoint(
-            endpoint_for_setting=(ep2.node, ep2.position),
-            adjacent_endpoint=(ep1.node, ep1.position),
-            create_using=type(ep1).reverse_type(),
-            **k.nodes[ep1.node].attr,
-        )
+    # Rewrite all endpoints with reversed endpoint types (each slot is rewritten from its own old value).
+    nodes = k._nodes
+    for inst in nodes.values():
+        inc = inst._inc
+        for pos, adj_ep in enumerate(inc):
+            inc[pos] = _REVERSED_ENDPOINT_TYPE[type(adj_ep)](adj_ep.node, adj_ep.position, **nodes[adj_ep.node].attr)
 
     if k.name and isinstance(k.name, str):
         if k.name[0] == "+":
@@ -38,9 +38,8 @@ def remove_empty_nodes(k: PlanarDiagram, inplace: bool = True) -> PlanarDiagram:
     if not inplace:
         k = k.copy()
 
-    for n in list(k.nodes):
-        if not k.nodes[n]:
-            k.remove_node(n)
+    for n in [node for node, inst in k._nodes.items() if not inst._inc]:
+        k.remove_node(n)
     return k
 
 
@@ -77,11 +76,11 @@ def remove_loops(k: PlanarDiagram) -> int:
     Returns:
         The number of removed loops.
     """
-    count = 0
-    # Repeatedly query loops; remove one by one
-    while (ls := loops(k)):
-        k.remove_arc(ls[0])
-        count += 1
+    # Removing endpoints does not create new loops, so a single scan suffices. All loop endpoints are
+    # removed in one call, which takes care of the position shifts between them.
+    ls = loops(k)
+    k.remove_endpoints_from([ep for arc in ls for ep in arc])
+    count = len(ls)
 
     if "name" in k.attr:
         del k.attr["name"]
@@ -126,15 +125,16 @@ def remove_bivalent_vertex(k: PlanarDiagram, node, keep_if_unknot: bool = True)
     if k.degree(node) != 2:
         raise ValueError(f"Node {node} is not a bivalent vertex.")
 
-    ep_a, ep_b = k.nodes[node]
+    nodes = k._nodes
+    ep_a, ep_b = nodes[node]._inc
 
     # keep trivial loop (optional)
     if keep_if_unknot and ep_a.node == ep_b.node == node:
         return
 
-    # splice
-    k.set_endpoint(ep_a, ep_b)
-    k.set_endpoint(ep_b, ep_a)
+    # splice (the endpoints at the vertex are dropped with it, so they can be moved as they are)
+    nodes[ep_a.node]._inc[ep_a.position] = ep_b
+    nodes[ep_b.node]._inc[ep_b.position] = ep_a
     k.remove_node(node, remove_incident_endpoints=False)
 
 
@@ -158,24 +158,26 @@ def remove_bivalent_vertices(k: PlanarDiagram, match_attributes: bool = False) -
     if not hasattr(k, "vertices"):
         raise TypeError(f"Cannot remove bivalent vertices from type {type(k)}.")
 
+    nodes = k._nodes
+    oriented = k.is_oriented()
+
     removed = 0
-    candidates = {node for node in k.vertices if len(k.nodes[node]) == 2}
+    candidates = {node for node in k.vertices if len(nodes[node]._inc) == 2}
 
     while candidates:
         node = candidates.pop()
 
-        # incident endpoints at node
-        b0 = k.endpoint_from_pair((node, 0))
-        a0 = k.twin(b0)
-        b1 = k.endpoint_from_pair((node, 1))
-        a1 = k.twin(b1)
+        # adjacent endpoints (a0, a1) and incident endpoints (b0, b1) at node
+        a0, a1 = nodes[node]._inc
+        b0 = nodes[a0.node]._inc[a0.position]
+        b1 = nodes[a1.node]._inc[a1.position]
 
         # keep loops intact
-        if b0.node == a0.node or b1.node == a1.node:
+        if a0.node == node or a1.node == node:
             continue
 
         # oriented: skip incoherent pairing
-        if k.is_oriented() and (type(a0) is type(a1)):
+        if oriented and (type(a0) is type(a1)):
             continue
 
         # attribute compatibility gate (only remove if they match when requested)
@@ -183,8 +185,8 @@ def remove_bivalent_vertices(k: PlanarDiagram, match_attributes: bool = False) -
             continue
 
         # splice a0 <-> a1
-        k.nodes[a0.node][a0.position] = a1
-        k.nodes[a1.node][a1.position] = a0
+        nodes[a0.node]._inc[a0.position] = a1
+        nodes[a1.node]._inc[a1.position] = a0
         k.remove_node(node_for_removing=node, remove_incident_endpoints=False)
         removed += 1
 
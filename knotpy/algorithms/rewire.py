@@ -1,7 +1,7 @@
 # knotpy/algorithms/rewire.py
 
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram
-from knotpy.algorithms.subdivide import subdivide_endpoint
+from knotpy.algorithms.subdivide import subdivide_endpoint, _stitch
 from knotpy.algorithms.insert import insert_new_leaf
 from knotpy.algorithms.remove import remove_bivalent_vertex
 from knotpy.classes.endpoint import Endpoint
@@ -27,8 +27,8 @@ def pull_and_plug_endpoint(
     src_node, src_pos = source_endpoint
     dst_node, dst_pos = destination_endpoint
 
-    # get attributes
-    src_attr = k.endpoint_from_pair(source_endpoint).attr
+    # get attributes (the source endpoint instance is the twin of its adjacent endpoint)
+    src_attr = (source_endpoint if isinstance(source_endpoint, Endpoint) else k.twin(adjacent_endpoint)).attr
     adj_attr = adjacent_endpoint.attr
 
     bi_node = subdivide_endpoint(k, source_endpoint)  # split the initial arc
@@ -41,8 +41,7 @@ def pull_and_plug_endpoint(
     endpoint_to_remove = k.twin((bi_node, 0))
 
     # connect the new stubs
-    k.set_endpoint(endpoint_for_setting=(bi_node, 0), adjacent_endpoint=(leaf_node, 1), **adj_attr)
-    k.set_endpoint(endpoint_for_setting=(leaf_node, 1), adjacent_endpoint=(bi_node, 0), **src_attr)
+    _stitch(k, (bi_node, 0), (leaf_node, 1), Endpoint, Endpoint, adj_attr, src_attr)
 
     # remove old source side and clean up
     k.remove_endpoint(endpoint_to_remove)
@@ -82,12 +81,7 @@ def replug_endpoint(
         create_using=type(src_ep),
         **src_ep.attr,
     )
-    k.set_endpoint(
-        endpoint_for_setting=adj_ep,
-        adjacent_endpoint=(dst_node, dst_pos),
-        create_using=type(adj_ep),
-        **adj_ep.attr,
-    )
+    k._nodes[adj_ep.node]._inc[adj_ep.position] = type(adj_ep)(dst_node, dst_pos, **adj_ep.attr)
 
     k.remove_endpoint(src_ep)
 
@@ -109,14 +103,13 @@ def swap_endpoints(
     if not isinstance(ep2, Endpoint):
         ep2 = k.endpoint_from_pair(ep2)
 
-    twin1 = k.twin(ep1)
-    twin2 = k.twin(ep2)
-
-    k.set_endpoint(endpoint_for_setting=ep1, adjacent_endpoint=twin2)
-    k.set_endpoint(endpoint_for_setting=twin2, adjacent_endpoint=ep1)
+    nodes = k._nodes
+    twin1 = nodes[ep1.node]._inc[ep1.position]
+    twin2 = nodes[ep2.node]._inc[ep2.position]
 
-    k.set_endpoint(endpoint_for_setting=ep2, adjacent_endpoint=twin1)
-    k.set_endpoint(endpoint_for_setting=twin1, adjacent_endpoint=ep2)
+    # each slot receives a copy of the endpoint it should point to (in the order set_endpoint would write them)
+    for ep, adj_ep in ((ep1, twin2), (twin2, ep1), (ep2, twin1), (twin1, ep2)):
+        nodes[ep.node]._inc[ep.position] = type(adj_ep)(adj_ep.node, adj_ep.position, **adj_ep.attr)
 
 
 def permute_node(
@@ -134,33 +127,22 @@ def permute_node(
         node: Node label.
         permutation: Mapping or sequence giving new index for each old index.
     """
-    adj_endpoints = [adj_ep for adj_ep in k.nodes[node]]  # snapshot
-    node_endpoint_inst = [k.twin(adj_ep) for adj_ep in adj_endpoints]
+    nodes = k._nodes
+    inc = nodes[node]._inc
+    adj_endpoints = list(inc)  # snapshot
+    node_endpoint_inst = [nodes[adj_ep.node]._inc[adj_ep.position] for adj_ep in adj_endpoints]
 
     for pos, adj_ep in enumerate(adj_endpoints):
+        new_pos = permutation[pos]
         if adj_ep.node != node:  # no loop
-            # set adjacent
-            k.set_endpoint(
-                endpoint_for_setting=(node, permutation[pos]),
-                adjacent_endpoint=(adj_ep.node, adj_ep.position),
-                create_using=type(adj_ep),
-                **adj_ep.attr,
-            )
+            # set adjacent (the old endpoint object is moved, as every position receives exactly one)
+            inc[new_pos] = adj_ep
             # set self
-            k.set_endpoint(
-                endpoint_for_setting=adj_ep,
-                adjacent_endpoint=(node, permutation[pos]),
-                create_using=type(node_endpoint_inst[pos]),
-                **node_endpoint_inst[pos].attr,
-            )
+            ep = node_endpoint_inst[pos]
+            nodes[adj_ep.node]._inc[adj_ep.position] = type(ep)(node, new_pos, **ep.attr)
         else:
             # loop case
-            k.set_endpoint(
-                endpoint_for_setting=(node, permutation[pos]),
-                adjacent_endpoint=(adj_ep.node, permutation[adj_ep.position]),
-                create_using=type(adj_ep),
-                **adj_ep.attr,
-            )
+            inc[new_pos] = type(adj_ep)(node, permutation[adj_ep.position], **adj_ep.attr)
 
 
 if __name__ == "__main__":
@@ -5,9 +5,33 @@ __all__ = ["sanity_check"]
 __version__ = "0.2"
 __author__ = "Boštjan Gabrovšek"
 
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram, Diagram, DiagramCollection
+from knotpy.classes.endpoint import OutgoingEndpoint, IngoingEndpoint
+
+# endpoint type pairs of a correctly oriented arc
+_OPPOSITE_ENDPOINT_TYPES = frozenset({(OutgoingEndpoint, IngoingEndpoint), (IngoingEndpoint, OutgoingEndpoint)})
+
+
+class _SanityError(ValueError):
+    """Sanity check failure whose message is formatted only when displayed (``sanity_check`` never displays it)."""
+
+    def __str__(self) -> str:
+        message, *values = self.args
+        return message.format(*values)
+
+
+def _first_duplicate(items):
+    """Return the first item that already appeared earlier in ``items``, or ``None`` if all items are distinct."""
+    seen = set()
+    for item in items:
+        if item in seen:
+            return item
+        seen.add(item)
+    return None
 
 
 def sanity_check_raise_exception(k: Diagram | DiagramCollection) -> bool:
@@ -31,83 +55,85 @@ def sanity_check_raise_exception(k: Diagram | DiagramCollection) -> bool:
     # Lazy imports to keep import time low
     from knotpy.algorithms.disjoint_union import number_of_disjoint_components
     from knotpy.algorithms.cut_set import cut_nodes
-    from knotpy.classes.endpoint import Endpoint, OutgoingEndpoint, IngoingEndpoint
 
     if not isinstance(k, (PlanarDiagram, OrientedPlanarDiagram)):
         raise TypeError(f"Expected a PlanarDiagram/OrientedPlanarDiagram, got {type(k)}")
 
-    # 1) Endpoint node membership
-    for ep in k.endpoints:
-        if ep.node not in k.nodes:
-            raise ValueError(f"Endpoint {ep} references missing node {ep.node}; available: {set(k.nodes)}")
-
-    # 2) Endpoint positions within node degree
-    for ep in k.endpoints:
-        deg = k.degree(ep.node)
-        if not (0 <= ep.position < deg):
-            raise ValueError(f"Endpoint {ep} has position {ep.position} outside node degree {deg}")
+    # bound once, used in the loops below
+    twin = k.twin
+    degree = k.degree
+    node_view = k.nodes
 
-    faces = list(k.faces)
     endpoints = list(k.endpoints)
-    arcs = list(k.arcs)
-    nodes = list(k.nodes)
+    nodes = list(node_view)
+    degrees = {n: degree(n) for n in nodes}
+    number_of_endpoints = len(endpoints)
+
+    # 1) Endpoint node membership and 2) endpoint positions within node degree
+    for ep in endpoints:
+        if ep.node not in degrees:
+            raise _SanityError("Endpoint {} references missing node {}; available: {}", ep, ep.node, set(nodes))
+        deg = degrees[ep.node]
+        if not (0 <= ep.position < deg):
+            raise _SanityError("Endpoint {} has position {} outside node degree {}", ep, ep.position, deg)
 
     # 3) No None endpoints in node incidence lists
     for n in nodes:
-        for i in range(len(k.nodes[n])):
-            if k.nodes[n][i] is None:
-                raise ValueError(f"None endpoint found in node {n} at position {i}")
+        for i, ep in enumerate(node_view[n]):
+            if ep is None:
+                raise _SanityError("None endpoint found in node {} at position {}", n, i)
 
     # 4) Endpoints are unique
-    if len(endpoints) != len(set(endpoints)):
+    if _first_duplicate(endpoints) is not None:
         dup = [e for e, c in Counter(endpoints).items() if c > 1]
-        raise ValueError(f"Duplicate endpoints detected: {dup}")
+        raise _SanityError("Duplicate endpoints detected: {}", dup)
+
+    arcs = list(k.arcs)
+    number_of_arcs = len(arcs)
 
     # 5) Endpoints count matches twice the arcs
-    if len(endpoints) != 2 * len(arcs):
-        raise ValueError(
-            "Endpoints count must equal 2×|arcs|.\n"
-            f"Diagram: {k}\n"
-            f"#endpoints={len(endpoints)}, #arcs={len(arcs)}\n"
-            f"Endpoints: {endpoints}\nArcs: {arcs}"
+    if number_of_endpoints != 2 * number_of_arcs:
+        raise _SanityError(
+            "Endpoints count must equal 2×|arcs|.\nDiagram: {}\n#endpoints={}, #arcs={}\nEndpoints: {}\nArcs: {}",
+            k, number_of_endpoints, number_of_arcs, endpoints, arcs,
         )
 
-    # 6) All twins valid and involutive
+    # 6) All twins involutive (endpoints were matched to nodes and degrees in 1) and 2))
     for ep in endpoints:
-        if ep.node not in k.nodes or not (0 <= ep.position < k.degree(ep.node)):
-            raise ValueError(f"Endpoint {ep} does not match a node (invalid node or degree)")
-        twin = k.twin(ep)
-        if k.twin(twin) != ep:
-            raise ValueError(f"twin(twin({ep})) != {ep}; got {k.twin(twin)}")
+        twin_twin = twin(twin(ep))
+        if twin_twin != ep:
+            raise _SanityError("twin(twin({})) != {}; got {}", ep, ep, twin_twin)
+
+    # Faces are only traversed once the cheaper endpoint and arc checks have passed
+    faces = list(k.faces)
 
     # 7) Euler characteristic per component
-    euler_characteristic = len(nodes) - len(arcs) + len(faces)
+    euler_characteristic = len(nodes) - number_of_arcs + len(faces)
     expected = 2 * number_of_disjoint_components(k)
     if euler_characteristic != expected:
-        raise ValueError(f"Euler characteristic {euler_characteristic} != {expected} (2×components). Diagram: {k}")
+        raise _SanityError("Euler characteristic {} != {} (2×components). Diagram: {}", euler_characteristic, expected, k)
 
     # 8) Oriented diagrams: endpoint/crossing orientation consistency
     if k.is_oriented():
-        for ep in k.endpoints:
+        for ep in endpoints:
             if not isinstance(ep, (OutgoingEndpoint, IngoingEndpoint)):
-                raise ValueError("Oriented diagram has non-oriented endpoints")
+                raise _SanityError("Oriented diagram has non-oriented endpoints")
 
-        for ep1, ep2 in k.arcs:
-            pair = (type(ep1), type(ep2))
-            if pair not in {(OutgoingEndpoint, IngoingEndpoint), (IngoingEndpoint, OutgoingEndpoint)}:
-                raise ValueError(f"Arc {ep1, ep2} is not oppositely oriented")
+        for ep1, ep2 in arcs:
+            if (type(ep1), type(ep2)) not in _OPPOSITE_ENDPOINT_TYPES:
+                raise _SanityError("Arc {} is not oppositely oriented", (ep1, ep2))
 
         for crossing in k.crossings:
-            ep0, ep1, ep2, ep3 = k.nodes[crossing]
-            if type(ep0) is type(ep2):
-                raise ValueError(f"Crossing {crossing}: opposite endpoints (0,2) must have opposite orientation")
-            if type(ep1) is type(ep3):
-                raise ValueError(f"Crossing {crossing}: opposite endpoints (1,3) must have opposite orientation")
+            t0, t1, t2, t3 = map(type, node_view[crossing])
+            if t0 is t2:
+                raise _SanityError("Crossing {}: opposite endpoints (0,2) must have opposite orientation", crossing)
+            if t1 is t3:
+                raise _SanityError("Crossing {}: opposite endpoints (1,3) must have opposite orientation", crossing)
             # One of (0,1)/(0,3) must match, symmetrically for ep2
-            if not (type(ep0) is type(ep1) or type(ep0) is type(ep3)):
-                raise ValueError(f"Crossing {crossing}: ep0 must match one of ep1/ep3")
-            if not (type(ep2) is type(ep1) or type(ep2) is type(ep3)):
-                raise ValueError(f"Crossing {crossing}: ep2 must match one of ep1/ep3")
+            if not (t0 is t1 or t0 is t3):
+                raise _SanityError("Crossing {}: ep0 must match one of ep1/ep3", crossing)
+            if not (t2 is t1 or t2 is t3):
+                raise _SanityError("Crossing {}: ep2 must match one of ep1/ep3", crossing)
 
     # 9) Faces consistency
     #    - Non-cut nodes appear at most once per face
@@ -115,28 +141,32 @@ def sanity_check_raise_exception(k: Diagram | DiagramCollection) -> bool:
     #    - Node degree equals its appearances across faces
     cut = cut_nodes(k)
 
+    seen = set()
+    per_node_face_count = Counter()
     for face in faces:
         counts = Counter(ep.node for ep in face)
         for node, count in counts.items():
             if node not in cut and count != 1:
-                raise ValueError(f"Non-cut node {node} appears {count} times in face {face}")
+                raise _SanityError("Non-cut node {} appears {} times in face {}", node, count, face)
+        per_node_face_count.update(counts)
+
+        for ep in face:
+            if ep in seen:
+                raise _SanityError("Some endpoints appear multiple times across faces")
+            seen.add(ep)
 
-    face_endpoints = [ep for face in faces for ep in face]
-    if len(face_endpoints) != len(set(face_endpoints)):
-        raise ValueError("Some endpoints appear multiple times across faces")
-    if len(face_endpoints) != len(endpoints):
-        raise ValueError("Not all endpoints are represented in faces")
+    if len(seen) != number_of_endpoints:
+        raise _SanityError("Not all endpoints are represented in faces")
 
-    per_node_face_count = Counter(ep.node for ep in face_endpoints)
     for node, count in per_node_face_count.items():
-        if k.degree(node) != count:
-            raise ValueError(f"Face incidence count {count} for node {node} != degree {k.degree(node)}")
+        if degrees[node] != count:
+            raise _SanityError("Face incidence count {} for node {} != degree {}", count, node, degrees[node])
 
     return True
 
 
 
-def sanity_check(k: Diagram | DiagramCollection) -> bool:
+def sanity_check(k: Diagram | DiagramCollection, parallel: bool = False, max_workers: int | None = None) -> bool:
     """
     Run structural sanity checks on a planar (or oriented) diagram.
 
@@ -146,16 +176,23 @@ def sanity_check(k: Diagram | DiagramCollection) -> bool:
 
     Args:
         k: A single diagram or a collection of diagrams.
+        parallel: Check the diagrams of a collection in parallel using processes.
+        max_workers: Number of workers; defaults to ``os.cpu_count()``.
 
     Returns:
         True if all checks pass, false otherwise.
     """
     # Allow collections
+    if parallel and isinstance(k, (list, set, tuple)):
+        max_workers = max_workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunksize = max(1, len(k) // (4 * max_workers))
+            return all(executor.map(sanity_check, k, chunksize=chunksize))
+
     try:
-       sanity_check_raise_exception(k)
+       return sanity_check_raise_exception(k)
     except ValueError:
        return False
-    return True
 
 if __name__ == "__main__":
     pass
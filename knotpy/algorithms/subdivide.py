@@ -6,6 +6,16 @@ from knotpy.classes.endpoint import Endpoint
 from knotpy.algorithms.naming import unique_new_node_name
 
 
+def _stitch(k: PlanarDiagram, a_pair: tuple, b_pair: tuple, a_type: type, b_type: type, a_attr: dict, b_attr: dict) -> None:
+    """Internal: connect positions ``a_pair`` and ``b_pair`` by an arc.
+
+    The endpoint stored at ``a_pair`` (pointing to ``b_pair``) is created with ``a_type`` and ``a_attr``,
+    the one stored at ``b_pair`` with ``b_type`` and ``b_attr``.
+    """
+    k.set_endpoint(endpoint_for_setting=a_pair, adjacent_endpoint=b_pair, create_using=a_type, **a_attr)
+    k.set_endpoint(endpoint_for_setting=b_pair, adjacent_endpoint=a_pair, create_using=b_type, **b_attr)
+
+
 def subdivide_arc(
     k: PlanarDiagram,
     arc,  # typically: frozenset[{(node, pos), (node, pos)}] but tuples/lists also work
@@ -33,41 +43,20 @@ def subdivide_arc(
     endpoint_a = k.endpoint_from_pair(endpoint_a)
     endpoint_b = k.endpoint_from_pair(endpoint_b)
 
-    a_attr = endpoint_a.attr | attr
-    b_attr = endpoint_b.attr | attr
+    # merge the extra attributes only if there are any (set_endpoint copies them anyway)
+    a_attr = endpoint_a.attr | attr if attr else endpoint_a.attr
+    b_attr = endpoint_b.attr | attr if attr else endpoint_b.attr
+    a_pair, a_type = (endpoint_a.node, endpoint_a.position), type(endpoint_a)
+    b_pair, b_type = (endpoint_b.node, endpoint_b.position), type(endpoint_b)
 
     if new_node_name is None:
         new_node_name = unique_new_node_name(k)
 
     k.add_node(node_for_adding=new_node_name, create_using=Vertex, degree=2)
 
-    # Connect new node position 0 to endpoint_a; update both directions
-    k.set_endpoint(
-        endpoint_for_setting=(new_node_name, 0),
-        adjacent_endpoint=(endpoint_a.node, endpoint_a.position),
-        create_using=type(endpoint_a),
-        **b_attr,
-    )
-    k.set_endpoint(
-        endpoint_for_setting=(endpoint_a.node, endpoint_a.position),
-        adjacent_endpoint=(new_node_name, 0),
-        create_using=type(endpoint_b),
-        **a_attr,
-    )
-
-    # Connect new node position 1 to endpoint_b; update both directions
-    k.set_endpoint(
-        endpoint_for_setting=(new_node_name, 1),
-        adjacent_endpoint=(endpoint_b.node, endpoint_b.position),
-        create_using=type(endpoint_b),
-        **b_attr,
-    )
-    k.set_endpoint(
-        endpoint_for_setting=(endpoint_b.node, endpoint_b.position),
-        adjacent_endpoint=(new_node_name, 1),
-        create_using=type(endpoint_a),
-        **a_attr,
-    )
+    # Connect new node position 0 to endpoint_a and position 1 to endpoint_b
+    _stitch(k, (new_node_name, 0), a_pair, a_type, b_type, b_attr, a_attr)
+    _stitch(k, (new_node_name, 1), b_pair, b_type, a_type, b_attr, a_attr)
 
     return new_node_name
 
@@ -115,35 +104,16 @@ def subdivide_endpoint_by_crossing(
 
     new_node_name = unique_new_node_name(k)
     crossing_position = crossing_position % 4
+    opposite_position = (crossing_position + 2) % 4
+
+    ep_pair, ep_type, ep_attr = (endpoint.node, endpoint.position), type(endpoint), endpoint.attr
+    twin_pair, twin_type, twin_attr = (twin_endpoint.node, twin_endpoint.position), type(twin_endpoint), twin_endpoint.attr
 
     k.add_crossing(crossing_for_adding=new_node_name, **attr)
 
     # Connect crossing_position with endpoint; and its opposite with twin
-    k.set_endpoint(
-        endpoint_for_setting=(new_node_name, crossing_position),
-        adjacent_endpoint=(endpoint.node, endpoint.position),
-        create_using=type(twin_endpoint),
-        **twin_endpoint.attr,
-    )
-    k.set_endpoint(
-        endpoint_for_setting=(endpoint.node, endpoint.position),
-        adjacent_endpoint=(new_node_name, crossing_position),
-        create_using=type(endpoint),
-        **endpoint.attr,
-    )
-
-    k.set_endpoint(
-        endpoint_for_setting=(new_node_name, (crossing_position + 2) % 4),
-        adjacent_endpoint=(twin_endpoint.node, twin_endpoint.position),
-        create_using=type(twin_endpoint),
-        **twin_endpoint.attr,
-    )
-    k.set_endpoint(
-        endpoint_for_setting=(twin_endpoint.node, twin_endpoint.position),
-        adjacent_endpoint=(new_node_name, (crossing_position + 2) % 4),
-        create_using=type(endpoint),
-        **endpoint.attr,
-    )
+    _stitch(k, (new_node_name, crossing_position), ep_pair, twin_type, ep_type, twin_attr, ep_attr)
+    _stitch(k, (new_node_name, opposite_position), twin_pair, twin_type, ep_type, twin_attr, ep_attr)
 
     return new_node_name
 
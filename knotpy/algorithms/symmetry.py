@@ -65,7 +65,7 @@ def mirror(
 
     # Apply the same permutation in both oriented and unoriented cases.
     for c in crossings:
-        permute_node(k, c, (1, 2, 3, 0))
+        _mirror_crossing(k, c)
 
     if k.name and isinstance(k.name, str):
         # if the link is oriented, add a '*' to the name before orientation signs
@@ -107,12 +107,48 @@ def flip(
         nodes = list(k.nodes)
 
     for node in nodes:
-        deg = k.degree(node)
-        # Reverse order: [deg-1, deg-2, ..., 0]
-        permute_node(k, node, list(range(deg - 1, -1, -1)))
+        _flip_node(k, node)
 
     return k
 
 
+def _update_twins(k: Diagram, node) -> None:
+    """Internal: point the twins of a loopless node's endpoints back to their current positions."""
+    nodes = k._nodes
+    for pos, adj_ep in enumerate(nodes[node]._inc):
+        adj_inc = nodes[adj_ep.node]._inc
+        ep = adj_inc[adj_ep.position]
+        adj_inc[adj_ep.position] = type(ep)(node, pos, **ep.attr)
+
+
+def _mirror_crossing(k: Diagram, crossing) -> None:
+    """Internal: apply the permutation ``(1, 2, 3, 0)`` to a crossing.
+
+    Without loops, the incidence list is rotated in place and only the twins are rewritten.
+    """
+    inc = k._nodes[crossing]._inc
+    if any(adj_ep.node == crossing for adj_ep in inc):
+        permute_node(k, crossing, (1, 2, 3, 0))
+        return
+
+    inc[:] = inc[3:] + inc[:3]
+    _update_twins(k, crossing)
+
+
+def _flip_node(k: Diagram, node) -> None:
+    """Internal: reverse the cyclic order of a node's endpoints.
+
+    Without loops, the incidence list is reversed in place and only the twins are rewritten.
+    """
+    inc = k._nodes[node]._inc
+    if any(adj_ep.node == node for adj_ep in inc):
+        # Reverse order: [deg-1, deg-2, ..., 0]
+        permute_node(k, node, list(range(len(inc) - 1, -1, -1)))
+        return
+
+    inc.reverse()
+    _update_twins(k, node)
+
+
 if __name__ == "__main__":
     pass
\ No newline at end of file
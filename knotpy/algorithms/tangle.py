@@ -66,18 +66,20 @@ def compose_tangles(tangle1: Diagram, tangle2: Diagram) -> Diagram:
     """
     k = disjoint_union(tangle1, tangle2)
 
-    # Connect endpoints by matching their "tangle_endpoint" labels
-    for i in range(4):
-        # Collect nodes with the given endpoint label
-        leafs = [
-            node for node in k.nodes
-            if k.nodes[node].attr.get("tangle_endpoint") == i
-        ]
-        if len(leafs) != 2:
-            raise ValueError(
-                "Cannot compose tangles: endpoint labels are missing or incorrect"
-            )
+    # Collect nodes by their "tangle_endpoint" label in a single pass
+    leafs_by_label = {i: [] for i in range(4)}
+    for node, inst in k.nodes.items():
+        label = inst.attr.get("tangle_endpoint")
+        if label in leafs_by_label:
+            leafs_by_label[label].append(node)
+
+    if any(len(leafs) != 2 for leafs in leafs_by_label.values()):
+        raise ValueError(
+            "Cannot compose tangles: endpoint labels are missing or incorrect"
+        )
 
+    # Connect endpoints by matching their "tangle_endpoint" labels
+    for leafs in leafs_by_label.values():
         # Identify the endpoints to connect
         endpoints = [
             k.twin(k.endpoints[leafs[0]][0]),
@@ -142,9 +144,12 @@ def is_integer_tangle(tangle: Diagram) -> bool:
     if number_of_crossings != len(tangle) - 4:
         return False
 
-    # All faces except one must be bigons
-    faces = tangle.faces()
-    if sum(len(face) == 2 for face in faces) != number_of_crossings - 1:
-        return False
+    # All faces except one must be bigons (stop as soon as there are too many)
+    bigons = 0
+    for face in tangle.faces:
+        if len(face) == 2:
+            bigons += 1
+            if bigons > number_of_crossings - 1:
+                return False
 
-    return True
\ No newline at end of file
+    return bigons == number_of_crossings - 1
\ No newline at end of file
@@ -28,14 +28,15 @@ def test_canonical_oriented():
     k_b = kp.orient(kp.from_knotpy_notation(native_b))
     k_c = kp.orient(kp.from_knotpy_notation(native_c))
 
-    assert kp.canonical(k_a) == kp.canonical(k_b)
-    assert kp.canonical(k_b) != kp.canonical(k_c)
-    assert kp.sanity_check(k_a)
-    assert kp.sanity_check(k_b)
     c_a = kp.canonical(k_a)
     c_b = kp.canonical(k_b)
     c_b_ = kp.canonical(kp.reverse(k_b))
     c_c = kp.canonical(k_c)
+
+    assert c_a == c_b
+    assert c_b != c_c
+    assert kp.sanity_check(k_a)
+    assert kp.sanity_check(k_b)
     assert c_a.is_oriented()
     assert c_b.is_oriented()
     assert c_c.is_oriented()
@@ -61,9 +62,10 @@ def test_canonical_degenerate_oriented():
     a = kp.orient(kp.from_knotpy_notation("a=V(a1 a0 a3 a2)"))
     b = kp.orientations(kp.from_knotpy_notation("a=V(a3 a2 a1 a0)"))
     ka = kp.canonical(a)
-    kb = [kp.canonical(_) for _ in b]
+    kb = kp.canonical_many(b)
     assert kp.sanity_check(ka)
-    assert all(kp.sanity_check(_) for _ in b)
+    assert kp.sanity_check(b)
+    assert kb == [kp.canonical(_) for _ in b]
     assert ka in kb
 
 def test_canonical_knots():
@@ -88,10 +90,39 @@ def test_canonical_knots_oriented():
     assert kp.sanity_check(c1)
     assert c1 == c2
 
+def test_canonical_disjoint_union():
+    k1 = kp.disjoint_union(kp.knot("3_1"), kp.knot("4_1"))
+    k2 = kp.disjoint_union(kp.knot("4_1"), kp.knot("3_1"))
+    k2._nodes = dict(reversed(list(k2._nodes.items())))  # node order should not matter
+    c1 = kp.canonical(k1)
+    c2 = kp.canonical(k2)
+    assert kp.sanity_check(c1)
+    assert kp.sanity_check(c2)
+    assert c1 == c2
+
+def test_canonical_cycle():
+    a = kp.from_knotpy_notation("a=V(b0 c1) b=V(a0 c0) c=V(b1 a1)")
+    b = kp.from_knotpy_notation("x=V(z1 y0) y=V(x1 z0) z=V(y1 x0)")
+    ca = kp.canonical(a)
+    cb = kp.canonical(b)
+    assert kp.sanity_check(ca)
+    assert ca == cb
+    assert kp.canonical(ca) == ca
+
+def test_canonical_isolated_vertex():
+    k = kp.path_graph(1)
+    k.relabel_nodes({"a": "x"})
+    c = kp.canonical(k)
+    assert list(c.nodes) == ["a"]
+    assert kp.canonical(c) == c
+
 if __name__ == "__main__":
     test_canonical()
     test_canonical_degenerate()
     test_canonical_knots()
     test_canonical_oriented()
     test_canonical_degenerate_oriented()
-    test_canonical_knots_oriented()
\ No newline at end of file
+    test_canonical_knots_oriented()
+    test_canonical_disjoint_union()
+    test_canonical_cycle()
+    test_canonical_isolated_vertex()
@@ -16,6 +16,16 @@ def test_closure():
     assert kp.sanity_check(b)
     assert not kp.is_knot(b)
 
+def test_closure_inplace():
+    k = kp.from_knotpy_notation("a → V(b0), b → X(a0 c0 c3 d0), c → X(b1 d3 e3 b2), d → X(b3 e2 f3 c1), e → X(f2 f0 d1 c2), f → X(e1 g0 e0 d2), g → V(f1)")
+    expected = kp.closure(k.copy(), under=True)
+
+    u = kp.closure(k, under=True, inplace=True)
+    assert u is k
+    assert kp.sanity_check(u)
+    assert u == expected
+
 
 if __name__ == '__main__':
-    test_closure()
\ No newline at end of file
+    test_closure()
+    test_closure_inplace()
\ No newline at end of file
@@ -0,0 +1,17 @@
+import knotpy as kp
+
+
+def test_cycles():
+    k31 = kp.knot("3_1")
+    k41 = kp.knot("4_1")
+
+    assert kp.cycles(k31, 1) == set()
+    assert kp.cycles(k31, 2) == {("a", "b"), ("a", "c"), ("b", "c")}
+    assert kp.cycles(k31, 3) == {("a", "b", "c")}
+    assert kp.cycles(k31, 4) == set()
+
+    assert [len(kp.cycles(k41, n)) for n in range(1, 5)] == [0, 6, 4, 3]
+
+
+if __name__ == '__main__':
+    test_cycles()
@@ -0,0 +1,19 @@
+import knotpy as kp
+
+def test_bridge_join():
+    a = kp.knot("3_1")
+    b = kp.knot("3_1")
+    j = kp.bridge_join(a, b, None)
+    assert len(j) == len(a) + len(b) + 2
+    assert kp.sanity_check(j)
+
+def test_crossing_join():
+    a = kp.knot("3_1")
+    b = kp.knot("4_1")
+    j = kp.crossing_join(a, b, None)
+    assert kp.sanity_check(j)
+
+
+if __name__ == "__main__":
+    test_bridge_join()
+    test_crossing_join()
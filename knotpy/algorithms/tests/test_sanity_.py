@@ -15,6 +15,23 @@ def test_sanity_valid_diagram():
     assert sanity_check(k) is True
 
 
+def test_sanity_parallel_collection():
+    """
+    Checking a collection in parallel should agree with the serial check.
+    """
+    import knotpy as kp
+
+    diagrams = [kp.knot(name) for name in ("3_1", "4_1", "5_2", "6_3")]
+    assert sanity_check(diagrams, parallel=True, max_workers=2) is True
+
+    broken = kp.knot("3_1")
+    inc = broken.nodes["a"]._inc
+    inc[0], inc[1] = inc[1], inc[0]  # twins no longer point back
+    diagrams.append(broken)
+    assert sanity_check(diagrams) is False
+    assert sanity_check(diagrams, parallel=True, max_workers=2) is False
+
+
 def test_sanity_raises_on_none_endpoints():
     """
     Adding a vertex with unassigned endpoints should trigger a 'None endpoint' error.
@@ -46,4 +63,5 @@ def test_sanity_raises_on_oriented_arc_with_same_direction():
 if __name__ == '__main__':
     test_sanity_raises_on_oriented_arc_with_same_direction()
     test_sanity_raises_on_none_endpoints()
+    test_sanity_parallel_collection()
     test_sanity_valid_diagram()
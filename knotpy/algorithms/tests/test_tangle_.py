@@ -21,6 +21,22 @@ def test_tangle_63():
     assert len(kp.arc_cut_sets(k, 4, minimum_partition_nodes=2, return_ccw_ordered_endpoints=True)) == 3
     assert len(kp.arc_cut_sets(k, 4, minimum_partition_nodes=2, return_partition=True, return_ccw_ordered_endpoints=True)) == 3
 
+def test_is_integer_tangle():
+    for d in kp.tangle_decompositions(kp.knot("5_2")):
+        for t in d:
+            if t.number_of_crossings == 2:
+                assert kp.is_integer_tangle(t)
+
+    # rational tangle (2 1) from a 5_2 decomposition, only one of its faces is a bigon
+    t = kp.from_knotpy_notation("b=X(d3 e0 i0 k0) d=X(m0 e2 e1 b0) e=X(b1 d2 d1 g0) g=V(e3) i=V(b2) k=V(b3) m=V(d0)")
+    assert t.number_of_crossings == 3
+    assert not kp.is_integer_tangle(t)
+
+    # too many bigons: two trivial strands next to a closed Hopf link
+    t = kp.from_knotpy_notation("a=X(b1 b0 b3 b2) b=X(a1 a0 a3 a2) v=V(w0) w=V(v0) x=V(y0) y=V(x0)")
+    assert not kp.is_integer_tangle(t)
+
 if __name__ == "__main__":
     test_tangle_63()
+    test_is_integer_tangle()
     test_decompose()
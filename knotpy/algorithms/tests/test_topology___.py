@@ -12,6 +12,22 @@ def test_adjacent():
     assert not kp.is_adjacent(k, ep1, ep3)
 
 
+def test_bridges():
+    assert not kp.bridges(kp.knot("6_2"))
+
+    g = kp.from_knotpy_notation("a=V(b0) b=V(a0 c0 d0) c=V(b1) d=V(b2 e0 e1) e=V(d1 d2)")
+    assert kp.bridges(g) == {frozenset(g.endpoints[node, pos] for node, pos in arc)
+                             for arc in ((("a", 0), ("b", 0)), (("b", 1), ("c", 0)), (("b", 2), ("d", 0)))}
+
+def test_overstrands():
+    k = kp.knot("3_1")
+    strands = kp.overstrands(k)
+    assert len(strands) == 3
+    assert set().union(*strands) == set(k.endpoints)
+    assert sum(len(s) for s in strands) == len(k.endpoints)
+
 
 if __name__ == '__main__':
-    test_adjacent()
\ No newline at end of file
+    test_adjacent()
+    test_bridges()
+    test_overstrands()
\ No newline at end of file
@@ -14,9 +14,9 @@ __all__ = [
 __version__ = "0.1"
 __author__ = "Boštjan Gabrovšek"
 
-from collections import defaultdict
+from collections import defaultdict, Counter
 
-from knotpy.utils.disjoint_union_set import DisjointSetUnion
+from knotpy.utils.disjoint_union_set import _uf_find, _uf_union
 from knotpy.classes.endpoint import Endpoint, OutgoingEndpoint, IngoingEndpoint
 from knotpy.algorithms.cut_set import _is_arc_cut_set
 from knotpy.classes.planardiagram import PlanarDiagram, OrientedPlanarDiagram, Diagram
@@ -34,8 +34,8 @@ def _is_vertex_an_unknot(k: PlanarDiagram, vertex) -> bool:
 def _split_nodes_by_type(k: PlanarDiagram) -> dict:
     """Group node names by their concrete node class."""
     grouped = defaultdict(set)
-    for node in k.nodes:
-        grouped[type(k.nodes[node])].add(node)
+    for node, inst in k._nodes.items():
+        grouped[type(inst)].add(node)
     return grouped
 
 
@@ -59,17 +59,17 @@ def is_knot(k: PlanarDiagram) -> bool:
 
     if is_unknot(k):
         return True
-    return all(type(k.nodes[node]) is Crossing for node in k.nodes) and number_of_link_components(k) == 1
+    return all(type(node) is Crossing for node in k._nodes.values()) and number_of_link_components(k) == 1
 
 
 def is_link(k: PlanarDiagram) -> bool:
     """Return True if all nodes are crossings (possibly multiple components)."""
-    return all(type(k.nodes[node]) is Crossing for node in k.nodes)
+    return all(type(node) is Crossing for node in k._nodes.values())
 
 
 def is_planar_graph(k: PlanarDiagram) -> bool:
     """Return True if all nodes are vertices (no crossings)."""
-    return all(type(k.nodes[node]) is Vertex for node in k.nodes)
+    return all(type(node) is Vertex for node in k._nodes.values())
 
 
 def is_empty_diagram(k: PlanarDiagram) -> bool:
@@ -128,18 +128,29 @@ def loops(k: PlanarDiagram) -> list:
 
 def is_kink(k: PlanarDiagram, endpoint: Endpoint) -> bool:
     """Return True if `endpoint` forms a kink at a crossing (CCW neighbor is itself)."""
-    if not isinstance(k.nodes[endpoint.node], Crossing):
-        return False
-    return k.nodes[endpoint.node][(endpoint.position - 1) % 4] == endpoint
+    node = k._nodes[endpoint.node]
+    return type(node) is Crossing and node._inc[(endpoint.position - 1) & 3] == endpoint
 
 
 def kinks(k: PlanarDiagram, crossing=None) -> set:
     """Return the set of kink endpoints; optionally restrict to a given `crossing`."""
+    nodes = k._nodes
     if crossing is None:
-        return {ep for ep in k.endpoints if is_kink(k, ep)}
-    if type(k.nodes[crossing]) is not Crossing:
+        crossings = [c for c, node in nodes.items() if type(node) is Crossing]
+    elif type(k.nodes[crossing]) is not Crossing:
         raise ValueError(f"The node {crossing} is not a crossing")
-    return {ep for ep in k.endpoints[crossing] if is_kink(k, ep)}
+    else:
+        crossings = (crossing,)
+
+    result = set()
+    for c in crossings:
+        inc = nodes[c]._inc
+        for pos in range(4):
+            # the endpoint (c, pos) is a kink if it is adjacent to its CCW neighbour (c, pos - 1)
+            ep = inc[(pos - 1) & 3]
+            if ep.node == c and ep.position == pos:
+                result.add(ep)
+    return result
 
 
 def kink_region_iterator(k: PlanarDiagram, of_node=None):
@@ -149,10 +160,11 @@ def kink_region_iterator(k: PlanarDiagram, of_node=None):
         k: Diagram.
         of_node: If given, only consider kinks attached to this node.
     """
+    nodes = k._nodes
     for node in (k.crossings if of_node is None else (of_node,)):
-        for ep in k.nodes[node]:
+        for ep in nodes[node]._inc:
             # Is ep equal to its CCW neighbor? (kink)
-            if ep == k.nodes[ep.node][(ep.position + 3) & 3]:
+            if ep == nodes[ep.node]._inc[(ep.position + 3) & 3]:
                 yield [ep]
 
 
@@ -163,7 +175,12 @@ def bridges(k: PlanarDiagram) -> set:
         This uses a face incidence heuristic (fast) which may not be valid for already disjoint diagrams.
         For a robust (but slower) cut-set test, use `_is_arc_cut_set`.
     """
-    return {arc for r in k.faces for arc in k.arcs if arc.issubset(r)}
+    # an arc is a bridge iff both of its endpoints lie on the boundary of the same face
+    ep_to_arc = {ep: arc for arc in k.arcs for ep in arc}
+    result = set()
+    for face in k.faces:
+        result.update(arc for arc, count in Counter(ep_to_arc[ep] for ep in face).items() if count == 2)
+    return result
 
 
 def is_bridge(k: PlanarDiagram, arc_or_endpoint) -> bool:
@@ -184,6 +201,10 @@ def is_bridge(k: PlanarDiagram, arc_or_endpoint) -> bool:
         raise TypeError("arc_or_endpoint must be an Endpoint or an arc (set/tuple/list of two Endpoints).")
 
 
+# order in which the endpoints of terminals are tried as starts of strands in edges()
+_START_PRIORITY = {OutgoingEndpoint: 0, IngoingEndpoint: 1, Endpoint: 2}
+
+
 def path_from_endpoint(k: PlanarDiagram, endpoint: Endpoint) -> list[Endpoint]:
     """Follow a strand starting at `endpoint` until reaching a vertex (or a cycle closes).
 
@@ -200,22 +221,43 @@ def path_from_endpoint(k: PlanarDiagram, endpoint: Endpoint) -> list[Endpoint]:
     if not isinstance(endpoint, Endpoint):
         raise TypeError(f"Endpoint {endpoint} should be of type Endpoint")
 
+    nodes = k._nodes
     path: list[Endpoint] = []
     ep: Endpoint = endpoint
 
     while True:
         path.append(ep)
-        path.append(twin_ep := k.twin(ep))  # jump to twin
-        if isinstance(k.nodes[twin_ep.node], Crossing):
-            ep = k.endpoint_from_pair((twin_ep.node, (twin_ep.position + 2) % 4))
-        else:
+        path.append(twin_ep := nodes[ep.node]._inc[ep.position])  # jump to twin
+        node = nodes[twin_ep.node]
+        if type(node) is not Crossing:
             break
+        # the endpoint across the crossing is the twin of its twin
+        across = node._inc[(twin_ep.position + 2) & 3]
+        ep = nodes[across.node]._inc[across.position]
         if ep is endpoint:
             break
 
     return path
 
 
+def _endpoints_have_attributes(eps: list[Endpoint], attr: dict) -> bool:
+    """Return True if every endpoint in `eps` has all the key/value pairs of `attr`."""
+    for ept in eps:
+        for key, value in attr.items():
+            if key not in ept.attr or ept.attr[key] != value:
+                return False
+    return True
+
+
+def _mark_used(strand: list[Endpoint], offset: dict, used: bytearray) -> None:
+    """Mark the endpoints of `strand` as used, raising ValueError if any of them already is."""
+    for ep in strand:
+        i = offset[ep.node] + ep.position
+        if used[i]:
+            raise ValueError(f"Endpoints {strand} should be unused")
+        used[i] = 1
+
+
 def edges(k: PlanarDiagram, **endpoint_attributes) -> list[list[Endpoint]]:
     """Return ordered strands (“edges”) of the diagram.
 
@@ -230,48 +272,47 @@ def edges(k: PlanarDiagram, **endpoint_attributes) -> list[list[Endpoint]]:
     Returns:
         List of strands, each a list of `Endpoint`.
     """
+    nodes = k._nodes
     list_of_edges: list[list[Endpoint]] = []
-    unused_endpoints = set(k.endpoints)
-
-    # terminal nodes (vertices); prefer to start from Outgoing/Ingoing endpoints if oriented
-    terminals = [node for node in k.nodes if isinstance(k.nodes[node], Vertex)]
-
-    def _endpoints_have_attribute(eps: list[Endpoint], attr: dict) -> bool:
-        if not attr:
-            return True
-        for ept in eps:
-            for key, value in attr.items():
-                if key not in ept.attr or ept.attr[key] != value:
-                    return False
-        return True
 
-    priority = {OutgoingEndpoint: 0, IngoingEndpoint: 1, Endpoint: 2}
-    start_candidates = sorted(
-        (ep for node in terminals for ep in k.nodes[node]),
-        key=lambda x: priority.get(type(x), 3),
-    )
+    # the endpoint at (node, position) is identified by the integer offset[node] + position
+    offset = {}
+    n = 0
+    for node, inst in nodes.items():
+        offset[node] = n
+        n += len(inst._inc)
+    used = bytearray(n)
+
+    # endpoints of terminal nodes (vertices); prefer to start from Outgoing/Ingoing endpoints if oriented,
+    # the index keeps the sort stable
+    start_candidates = [
+        (_START_PRIORITY.get(type(ep), 3), index, ep)
+        for index, ep in enumerate(ep for inst in nodes.values() if type(inst) is Vertex for ep in inst._inc)
+    ]
+    start_candidates.sort()
 
     # Start with strands that originate at terminals
-    for ep in start_candidates:
-        if ep in unused_endpoints:
-            strand = path_from_endpoint(k, k.twin(ep))
-            strand_set = set(strand)
-            if not strand_set.issubset(unused_endpoints):
-                raise ValueError(f"Endpoints {strand} should be unused")
-            unused_endpoints -= strand_set
-            if _endpoints_have_attribute(strand, endpoint_attributes):
+    for _, _, ep in start_candidates:
+        if not used[offset[ep.node] + ep.position]:
+            strand = path_from_endpoint(k, nodes[ep.node]._inc[ep.position])
+            _mark_used(strand, offset, used)
+            if not endpoint_attributes or _endpoints_have_attributes(strand, endpoint_attributes):
                 list_of_edges.append(strand)
 
     # Remaining strands correspond to closed components
-    while unused_endpoints:
-        start = next(iter(unused_endpoints))
-        strand = path_from_endpoint(k, start)
-        strand_set = set(strand)
-        if not strand_set.issubset(unused_endpoints):
-            raise ValueError(f"Endpoints {strand} should be unused")
-        unused_endpoints -= strand_set
-        if _endpoints_have_attribute(strand, endpoint_attributes):
+    i = used.find(0)
+    if i >= 0:
+        endpoints = [None] * n
+        for inst in nodes.values():
+            for ep in inst._inc:
+                endpoints[offset[ep.node] + ep.position] = ep
+
+    while i >= 0:
+        strand = path_from_endpoint(k, endpoints[i])
+        _mark_used(strand, offset, used)
+        if not endpoint_attributes or _endpoints_have_attributes(strand, endpoint_attributes):
             list_of_edges.append(strand)
+        i = used.find(0, i + 1)
 
     return list_of_edges
 
@@ -286,20 +327,41 @@ def overstrands(k: Diagram):
     Returns:
         A list of sets (each set is an overstrand’s endpoints).
     """
-    dsu = DisjointSetUnion(k.endpoints)
-    for c in k.crossings:
-        eps = k.endpoints[c]
-        dsu[eps[1]] = k.endpoint_from_pair(eps[3])
-    for ep1, ep2 in k.arcs:
-        dsu[ep1] = k.endpoint_from_pair(ep2)
-    return dsu.classes()
+    nodes = k._nodes
+
+    # the endpoint at (node, position) is identified by the integer offset[node] + position
+    offset = {}
+    n = 0
+    for node, inst in nodes.items():
+        offset[node] = n
+        n += len(inst._inc)
+
+    parent = list(range(n))
+    rank = bytearray(n)
+
+    for node, inst in nodes.items():
+        i = offset[node]
+        for pos, adj_ep in enumerate(inst._inc):
+            _uf_union(parent, rank, i + pos, offset[adj_ep.node] + adj_ep.position)
+        if type(inst) is Crossing:
+            _uf_union(parent, rank, i + 1, i + 3)
+
+    # bucket the endpoints by their root, ordered by first appearance
+    classes = {}
+    for inst in nodes.values():
+        for ep in inst._inc:
+            classes.setdefault(_uf_find(parent, offset[ep.node] + ep.position), set()).add(ep)
+
+    return list(classes.values())
 
 def is_adjacent(k, obj1, obj2):
     """Return True if `obj1` and `obj2` are adjacent to each other in the diagram."""
 
     # node-node
-    if obj1 in k.nodes and obj2 in k.nodes:
-        return any(ep.node == obj2 for ep in k.nodes[obj1])
+    nodes = k._nodes
+    node_inst = nodes.get(obj1)
+    if node_inst is not None and obj2 in nodes:
+        return any(ep.node == obj2 for ep in node_inst._inc)
 
     # endpoint-endpoint
     if obj1 in k.endpoints and obj2 in k.endpoints:
@@ -175,6 +175,17 @@ class PlanarDiagram(_CrossingDiagram, _VertexDiagram, _VirtualCrossingDiagram):
         """
         return FaceView(self._nodes)
 
+    # Pickle support
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return state for pickling, leaving out cached views (they are recreated on access).
+
+        Returns:
+            dict: Serializable state.
+        """
+        cached = {"nodes", "endpoints", "arcs", "faces", *PlanarDiagram._nodes._node_type_property_names.values()}
+        return {key: value for key, value in self.__dict__.items() if key not in cached}
+
     # Basic protocol
 
     def __len__(self) -> int:
@@ -882,31 +893,29 @@ def planar_diagram_from_data(incoming_data: Any, create_using: type[PlanarDiagra
         # Copy attributes
         create_using.attr.update(incoming_data.attr)
 
-        # Copy nodes
-        for node in incoming_data.nodes:
-            node_instance = incoming_data.nodes[node]
+        # Copy nodes together with their endpoints. The endpoint stored at a position is copied as is,
+        # which is the same as setting the twin of every endpoint.
+        is_oriented = create_using.is_oriented()
+        for node, node_instance in incoming_data._nodes.items():
             create_using.add_node(
                 node_for_adding=node,
                 create_using=type(node_instance),
                 degree=len(node_instance),
                 **node_instance.attr,
             )
-
-        # Copy endpoints
-        for ep in incoming_data.endpoints:
-            adj_ep = incoming_data.twin(ep)
-            adj_ep_type = type(adj_ep)
-
-            # If target is unoriented, coerce oriented endpoints to plain Endpoint
-            if type(create_using) is PlanarDiagram and adj_ep_type is not Endpoint:
-                adj_ep_type = Endpoint
-
-            create_using.set_endpoint(
-                endpoint_for_setting=ep,
-                adjacent_endpoint=(adj_ep.node, adj_ep.position),
-                create_using=adj_ep_type,
-                **adj_ep.attr,
-            )
+            inc = create_using._nodes[node]._inc
+            for pos, adj_ep in enumerate(node_instance._inc):
+                adj_ep_type = type(adj_ep)
+
+                # If target is unoriented, coerce oriented endpoints to plain Endpoint
+                if adj_ep_type.is_oriented() != is_oriented:
+                    if is_oriented:
+                        raise ValueError(
+                            f"Cannot add an unoriented endpoint ({adj_ep_type.__name__}) to an oriented diagram ({type(create_using).__name__})"
+                        )
+                    adj_ep_type = Endpoint
+
+                inc[pos] = adj_ep_type(adj_ep.node, adj_ep.position, **adj_ep.attr)
 
     elif incoming_data is None:
         # Empty diagram
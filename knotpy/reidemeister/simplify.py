@@ -293,7 +293,7 @@ def reduce_equivalent_diagrams(diagrams: set | list, depth: int = 1, flype: bool
     if "FLIP" in settings.allowed_moves:
         leveled_sets = {
             k_str: LeveledSet(
-                items=crossing_non_increasing_space({canonical(from_condensed_em_notation(k_str)), canonical(flip(from_condensed_em_notation(k_str)))}, greediness=0, assume_canonical=True),
+                items=crossing_non_increasing_space({canonical(from_condensed_em_notation(k_str)), canonical(flip(from_condensed_em_notation(k_str), inplace=True))}, greediness=0, assume_canonical=True),
                 to_string=to_condensed_em_notation,
                 from_string=from_condensed_em_notation,
             )
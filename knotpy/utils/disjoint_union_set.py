@@ -12,6 +12,44 @@ __author__ = "Boštjan Gabrovšek <bostjan.gabrovsek@pef.uni-lj.si>"
 from typing import Hashable, Iterable, Iterator, Optional
 
 
+def _uf_find(parent: list[int], x: int) -> int:
+    """Return the root of ``x`` in an integer union-find forest, halving the path on the way.
+
+    Args:
+        parent: Parent array, where roots satisfy ``parent[x] == x``.
+        x: Element id.
+
+    Returns:
+        The root of the class containing ``x``.
+    """
+    while parent[x] != x:
+        parent[x] = x = parent[parent[x]]
+    return x
+
+
+def _uf_union(parent: list[int], rank: bytearray, x: int, y: int) -> None:
+    """Merge the classes of ``x`` and ``y`` in an integer union-find forest (union by rank).
+
+    This is a lean counterpart of :class:`DisjointSetUnion` for hot loops over
+    contiguous integer ids, e.g. ``parent = list(range(n))`` and ``rank = bytearray(n)``.
+
+    Args:
+        parent: Parent array.
+        rank: Rank array.
+        x: First element id.
+        y: Second element id.
+    """
+    x = _uf_find(parent, x)
+    y = _uf_find(parent, y)
+    if x == y:
+        return
+    if rank[x] < rank[y]:
+        x, y = y, x
+    parent[y] = x
+    if rank[x] == rank[y]:
+        rank[x] += 1
+
+
 class DisjointSetUnion:
     """Union–Find / Disjoint Set Union (DSU).
 